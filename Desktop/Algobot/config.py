@@ -25,6 +25,13 @@ TAKE_PROFIT_PIPS = 40  # 40 pips take profit (fallback)
 MAX_POSITION_SIZE = 1.0  # Maximum lot size per position
 MIN_POSITION_SIZE = 0.001  # Minimum lot size per position
 
+# Contract size (units per 1.0 lot) used for PnL; symbols not listed use the FX default
+CONTRACT_SIZES = {
+    "XAUUSD": 100,  # 100 troy ounces per lot
+    "XAUEUR": 100,
+}
+DEFAULT_CONTRACT_SIZE = 100000  # Standard FX lot
+
 # Volatility Settings
 ATR_PERIOD = 14  # Period for Average True Range calculation
 ATR_MULTIPLIER = 2.0  # Multiplier for ATR-based position sizing
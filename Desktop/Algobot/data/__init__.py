@@ -2,7 +2,9 @@
 Data module for handling MT5 data fetching and account operations.
 """
 from .fetch_mt5 import (
+    TIMEFRAME_CODES,
     fetch_mt5_data,
+    fetch_mt5_data_multi,
     get_account_info,
     list_available_symbols,
     login_mt5,
@@ -10,7 +12,9 @@ from .fetch_mt5 import (
 )
 
 __all__ = [
+    'TIMEFRAME_CODES',
     'fetch_mt5_data',
+    'fetch_mt5_data_multi',
     'get_account_info',
     'list_available_symbols',
     'login_mt5',
@@ -9,13 +9,16 @@ import time
 import psutil
 import platform
 import subprocess
-from typing import Optional, Dict, Any, List, Union, Tuple
+import threading
+import types
+from typing import Optional, Dict, Any, List, Sequence, Union, Tuple
 from datetime import datetime, timedelta
 
 import MetaTrader5 as mt5
 import pandas as pd
 
 from config import MT5_LOGIN, MT5_PASSWORD, MT5_SERVER, MT5_TIMEOUT, MT5_RETRY_ATTEMPTS, MT5_RETRY_DELAY, MT5_CONNECTION_ACTIVE, MT5_CONNECTION_LOCK
+from utils.cache import ArrayCache, cache_key
 from utils.logger import get_logger
 
 logger = get_logger("MT5DataFetcher")
@@ -31,6 +34,30 @@ DEFAULT_MT5_PATHS = {
     ]
 }
 
+# MT5 timeframe constants, bound once at import
+TIMEFRAME_M1 = mt5.TIMEFRAME_M1
+TIMEFRAME_M5 = mt5.TIMEFRAME_M5
+TIMEFRAME_M15 = mt5.TIMEFRAME_M15
+TIMEFRAME_M30 = mt5.TIMEFRAME_M30
+TIMEFRAME_H1 = mt5.TIMEFRAME_H1
+TIMEFRAME_H4 = mt5.TIMEFRAME_H4
+TIMEFRAME_D1 = mt5.TIMEFRAME_D1
+
+# Timeframe strings accepted by fetch_mt5_data, mapped to MT5 timeframe constants (read-only)
+TIMEFRAME_CODES = types.MappingProxyType({
+    'M1': TIMEFRAME_M1,
+    'M5': TIMEFRAME_M5,
+    'M15': TIMEFRAME_M15,
+    'M30': TIMEFRAME_M30,
+    'H1': TIMEFRAME_H1,
+    'H4': TIMEFRAME_H4,
+    'D1': TIMEFRAME_D1,
+})
+_TIMEFRAME_NAMES = types.MappingProxyType({code: name for name, code in TIMEFRAME_CODES.items()})
+
+# Serialises copy_rates_from_pos calls, so a multi-timeframe fetch runs back to back
+_rates_lock = threading.RLock()
+
 class MT5ConnectionError(Exception):
     """Custom exception for MT5 connection errors"""
     pass
@@ -213,33 +240,88 @@ def check_connection() -> bool:
         logger.warning(f"Connection check failed: {str(e)}")
         return False
 
-def fetch_mt5_data(symbol: str, timeframe: str, n_bars: int = 1000, login=None, password=None, server=None, timeout=None) -> Optional[pd.DataFrame]:
+def _resolve_timeframe(timeframe: Union[str, int]) -> Optional[Tuple[int, str]]:
+    """MT5 constant and display name for a timeframe string or constant, None if unknown."""
+    if isinstance(timeframe, str):
+        if timeframe not in TIMEFRAME_CODES:
+            logger.error(f"Invalid timeframe: {timeframe}. Must be one of: {', '.join(TIMEFRAME_CODES.keys())}")
+            return None
+        return TIMEFRAME_CODES[timeframe], timeframe
+    return timeframe, _TIMEFRAME_NAMES.get(timeframe, str(timeframe))
+
+def _rates_to_frame(rates) -> pd.DataFrame:
+    """
+    DataFrame from an MT5 rates record array, time as index and tick_volume
+    renamed to volume. Copies each field once, where DataFrame(rates) +
+    set_index('time') copied the whole frame twice.
+    """
+    index = pd.to_datetime(rates['time'], unit='s').rename('time')
+    return pd.DataFrame({
+        'open': rates['open'],
+        'high': rates['high'],
+        'low': rates['low'],
+        'close': rates['close'],
+        'volume': rates['tick_volume'],
+        'spread': rates['spread'],
+        'real_volume': rates['real_volume'],
+    }, index=index)
+
+def _copy_rates(symbol: str, mt5_tf: int, n_bars: int, login=None, password=None, server=None, timeout=None):
+    """copy_rates_from_pos with one reconnect-and-retry on error."""
+    try:
+        with _rates_lock:
+            return mt5.copy_rates_from_pos(symbol, mt5_tf, 0, n_bars)
+    except Exception as e:
+        logger.error(f"Error fetching rates: {str(e)}")
+        # Try to reconnect and fetch again
+        if login_mt5(login=login, password=password, server=server, timeout=timeout):
+            with _rates_lock:
+                return mt5.copy_rates_from_pos(symbol, mt5_tf, 0, n_bars)
+    return None
+
+def _copy_rates_cached(symbol: str, mt5_tf: int, n_bars: int, cache: Optional[ArrayCache], login=None, password=None,
+                       server=None, timeout=None):
+    """
+    _copy_rates through an ArrayCache keyed by the last bar time. Closed bars
+    never change, so on a hit only the forming bar is requested from MT5 and
+    written over the cached copy of it.
+    """
+    if cache is None:
+        return _copy_rates(symbol, mt5_tf, n_bars, login=login, password=password, server=server, timeout=timeout)
+    latest = _copy_rates(symbol, mt5_tf, 1, login=login, password=password, server=server, timeout=timeout)
+    if latest is None or len(latest) == 0:
+        return latest
+    rates = cache.get(cache_key(symbol, mt5_tf, n_bars, int(latest['time'][-1])))
+    if rates is not None and len(rates) and rates.dtype == latest.dtype:
+        rates[-1] = latest[-1]
+        return rates
+    rates = _copy_rates(symbol, mt5_tf, n_bars, login=login, password=password, server=server, timeout=timeout)
+    if rates is not None and len(rates):
+        cache.put(cache_key(symbol, mt5_tf, n_bars, int(rates['time'][-1])), rates)
+    return rates
+
+def fetch_mt5_data(symbol: str, timeframe: Union[str, int], n_bars: int = 1000, login=None, password=None, server=None, timeout=None,
+                   keep_connection: bool = False, cache: Optional[ArrayCache] = None) -> Optional[pd.DataFrame]:
     """
     Fetch historical data from MT5 with enhanced error handling
     
     Args:
         symbol: Symbol to fetch data for (e.g., 'EURUSD')
-        timeframe: Timeframe string (e.g., 'H1', 'D1')
+        timeframe: Timeframe string (e.g., 'H1', 'D1') or an MT5 TIMEFRAME_* constant
         n_bars: Number of bars to fetch (max 5000)
+        keep_connection: Leave the MT5 connection open afterwards. Required
+            when fetching concurrently, since a shutdown would cut off the
+            other fetches.
+        cache: ArrayCache for the raw bars; repeated fetches then only
+            request the forming bar until a new bar opens
         
     Returns:
         DataFrame with OHLCV data or None if failed
     """
-    # Map timeframe string to MT5 timeframe constant
-    tf_map = {
-        'M1': mt5.TIMEFRAME_M1,
-        'M5': mt5.TIMEFRAME_M5,
-        'M15': mt5.TIMEFRAME_M15,
-        'H1': mt5.TIMEFRAME_H1,
-        'H4': mt5.TIMEFRAME_H4,
-        'D1': mt5.TIMEFRAME_D1,
-    }
-    
-    if timeframe not in tf_map:
-        logger.error(f"Invalid timeframe: {timeframe}. Must be one of: {', '.join(tf_map.keys())}")
+    resolved = _resolve_timeframe(timeframe)
+    if resolved is None:
         return None
-    
-    mt5_tf = tf_map[timeframe]
+    mt5_tf, timeframe = resolved
     
     if not login_mt5(login=login, password=password, server=server, timeout=timeout):
         return None
@@ -254,37 +336,14 @@ def fetch_mt5_data(symbol: str, timeframe: str, n_bars: int = 1000, login=None,
         logger.info(f"Fetching {n_bars} {timeframe} bars for {symbol}...")
         
         # Fetch the data with error handling
-        rates = None
-        try:
-            rates = mt5.copy_rates_from_pos(symbol, mt5_tf, 0, n_bars)
-        except Exception as e:
-            logger.error(f"Error fetching rates: {str(e)}")
-            # Try to reconnect and fetch again
-            if login_mt5(login=login, password=password, server=server, timeout=timeout):
-                rates = mt5.copy_rates_from_pos(symbol, mt5_tf, 0, n_bars)
+        rates = _copy_rates_cached(symbol, mt5_tf, n_bars, cache, login=login, password=password, server=server, timeout=timeout)
         
         if rates is None or len(rates) == 0:
             error = mt5.last_error()
             logger.error(f"No data received for {symbol} on {timeframe}: {error}")
             return None
         
-        # Process the data
-        df = pd.DataFrame(rates)
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        
-        # Rename columns for consistency
-        df.rename(columns={
-            'open': 'open',
-            'high': 'high',
-            'low': 'low',
-            'close': 'close',
-            'tick_volume': 'volume',
-            'real_volume': 'real_volume',
-            'spread': 'spread',
-        }, inplace=True)
-        
-        # Set time as index
-        df.set_index('time', inplace=True)
+        df = _rates_to_frame(rates)
         
         # Log success
         logger.info(f"✅ Successfully fetched {len(df)} {timeframe} bars for {symbol} "
@@ -296,7 +355,70 @@ def fetch_mt5_data(symbol: str, timeframe: str, n_bars: int = 1000, login=None,
         logger.error(f"Error in fetch_mt5_data: {str(e)}", exc_info=True)
         return None
     finally:
-        mt5.shutdown()
+        if not keep_connection:
+            mt5.shutdown()
+
+def fetch_mt5_data_multi(symbol: str, timeframes: Sequence[Union[str, int]], n_bars: int = 1000, login=None, password=None,
+                         server=None, timeout=None, keep_connection: bool = False,
+                         cache: Optional[ArrayCache] = None) -> Dict[Union[str, int], pd.DataFrame]:
+    """
+    Fetch historical data for several timeframes of one symbol
+    
+    Logs in and selects the symbol once, then requests every timeframe
+    back to back under the rates lock, instead of a full fetch_mt5_data
+    round per timeframe.
+    
+    Args:
+        symbol: Symbol to fetch data for (e.g., 'EURUSD')
+        timeframes: Timeframe strings or MT5 TIMEFRAME_* constants
+        n_bars: Number of bars to fetch per timeframe (max 5000)
+        keep_connection: Leave the MT5 connection open afterwards
+        cache: ArrayCache for the raw bars, as in fetch_mt5_data
+        
+    Returns:
+        Dict mapping each timeframe, as passed in, to its DataFrame.
+        Timeframes that could not be fetched are left out.
+    """
+    resolved = {tf: _resolve_timeframe(tf) for tf in timeframes}
+    resolved = {tf: r for tf, r in resolved.items() if r is not None}
+    if not resolved:
+        return {}
+    
+    if not login_mt5(login=login, password=password, server=server, timeout=timeout):
+        return {}
+    
+    frames: Dict[Union[str, int], pd.DataFrame] = {}
+    try:
+        # Ensure symbol is selected in Market Watch
+        if not mt5.symbol_select(symbol, True):
+            error = mt5.last_error()
+            logger.error(f"Failed to select {symbol}: {error}")
+            return {}
+        
+        logger.info(f"Fetching {n_bars} bars for {symbol} on {', '.join(name for _, name in resolved.values())}...")
+        
+        with _rates_lock:
+            rates_by_tf = {tf: _copy_rates_cached(symbol, mt5_tf, n_bars, cache, login=login, password=password,
+                                                  server=server, timeout=timeout)
+                           for tf, (mt5_tf, _) in resolved.items()}
+        
+        for tf, rates in rates_by_tf.items():
+            name = resolved[tf][1]
+            if rates is None or len(rates) == 0:
+                error = mt5.last_error()
+                logger.error(f"No data received for {symbol} on {name}: {error}")
+                continue
+            frames[tf] = _rates_to_frame(rates)
+        
+        logger.info(f"✅ Successfully fetched {len(frames)}/{len(resolved)} timeframes for {symbol}")
+        return frames
+        
+    except Exception as e:
+        logger.error(f"Error in fetch_mt5_data_multi: {str(e)}", exc_info=True)
+        return frames
+    finally:
+        if not keep_connection:
+            mt5.shutdown()
 
 def get_account_info(login=None, password=None, server=None, timeout=None) -> Optional[Dict[str, Any]]:
     """
@@ -11,7 +11,6 @@ from datetime import datetime, timedelta
 from typing import Optional
 import signal
 import sys
-import traceback
 from flask import Flask, request, jsonify
 
 # Import our modules
@@ -26,7 +25,7 @@ from data.fetch_mt5 import fetch_mt5_data, get_account_info, login_mt5
 import execution.mt5_executor as mt5_executor
 from utils.news_filter import NewsFilter
 from utils.analytics import TradeAnalytics
-from utils.alerts import send_email_alert, send_telegram_alert
+from utils.alerts import send_email_alert, send_telegram_alert, send_email_alert_async, send_telegram_alert_async
 
 logger = get_logger("EnhancedTrader")
 
@@ -181,11 +180,10 @@ class EnhancedTrader:
                 time.sleep(60)  # Check every minute
                 
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}")
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.exception("Error in trading loop: %s", e)
                 # ALERT: Send error alert
-                send_email_alert("Error in Trading Loop", str(e))
-                send_telegram_alert(f"Error in Trading Loop: {e}")
+                send_email_alert_async("Error in Trading Loop", str(e))
+                send_telegram_alert_async(f"Error in Trading Loop: {e}")
                 self.write_status_file()  # Update dashboard status on error
                 time.sleep(30)
     
@@ -279,8 +277,8 @@ class EnhancedTrader:
                 return  # No trade signal
 
             # Prevent opening new trade in same direction
-            for pos in self.risk_manager.open_positions.values():
-                if pos['symbol'] == symbol and pos['direction'] == ('buy' if signal > 0 else 'sell'):
+            for pos in self.risk_manager.open_positions:
+                if pos.symbol == symbol and pos.direction == ('buy' if signal > 0 else 'sell'):
                     logger.info(f"Position already open in same direction for {symbol}, skipping new trade.")
                     return
 
@@ -320,24 +318,23 @@ class EnhancedTrader:
             # Additional: Close trades after max duration or if unprofitable for too long
             max_duration = 60 * 60 * 4  # 4 hours
             max_unprofit_time = 60 * 60 * 2  # 2 hours
-            now = datetime.now()
-            for pos in self.risk_manager.open_positions.values():
-                if pos['symbol'] == symbol:
-                    entry_time = pos.get('entry_time')
-                    if entry_time:
-                        entry_dt = datetime.strptime(entry_time, '%Y-%m-%dT%H:%M:%S')
-                        duration = (now - entry_dt).total_seconds()
+            now_ns = time.time_ns()
+            # Iterate over a snapshot since remove_position edits the list in place
+            for pos in list(self.risk_manager.open_positions):
+                if pos.symbol == symbol:
+                    if pos.entry_time_ns:
+                        duration = (now_ns - pos.entry_time_ns) / 1e9
                         if duration > max_duration:
                             logger.info(f"Closing {symbol} position after max duration {duration/3600:.2f}h")
                             if not self.paper_trading:
-                                mt5_executor.close_position(pos['ticket'])
+                                mt5_executor.close_position(pos.ticket)
                             self.analytics.log_trade_exit(symbol, current_price, 0, reason='max_duration', duration=duration)
                             self.risk_manager.remove_position(symbol)
-                        elif duration > max_unprofit_time and pos.get('pnl', 0) < 0:
+                        elif duration > max_unprofit_time and pos.pnl < 0:
                             logger.info(f"Closing {symbol} position after prolonged unprofitability.")
                             if not self.paper_trading:
-                                mt5_executor.close_position(pos['ticket'])
-                            self.analytics.log_trade_exit(symbol, current_price, pos.get('pnl', 0), reason='max_unprofit_time', duration=duration)
+                                mt5_executor.close_position(pos.ticket)
+                            self.analytics.log_trade_exit(symbol, current_price, pos.pnl, reason='max_unprofit_time', duration=duration)
                             self.risk_manager.remove_position(symbol)
         except Exception as e:
             logger.error(f"Error checking position exits for {symbol}: {e}")
@@ -346,8 +343,7 @@ class EnhancedTrader:
         """Execute buy order with flexible stop-loss and take-profit, with alerting."""
         try:
             import MetaTrader5 as mt5
-            stop_loss = self.risk_manager.calculate_stop_loss(price, 'buy', data=data)
-            take_profit = self.risk_manager.calculate_take_profit(price, 'buy', data=data)
+            stop_loss, take_profit = self.risk_manager.calculate_sl_tp(price, 'buy', data=data)
             lot_size = self.risk_manager.calculate_position_size(price, stop_loss)
             # Calculate initial trailing stop
             trailing_stop = None
@@ -371,30 +367,29 @@ class EnhancedTrader:
                 self.risk_manager.add_position(symbol, 'buy', price, lot_size, stop_loss, take_profit, trailing_stop)
                 # ALERT: Send trade execution alert
                 msg = f"BUY EXECUTED: {symbol} at {price}\nSL: {stop_loss}, TP: {take_profit}, Lot: {lot_size}"
-                send_email_alert(f"Trade Executed: BUY {symbol}", msg)
-                send_telegram_alert(msg)
+                send_email_alert_async(f"Trade Executed: BUY {symbol}", msg)
+                send_telegram_alert_async(msg)
                 self.write_trade_history_file()
                 self.write_analytics_file()
                 return True
             else:
                 logger.error(f"Failed to execute buy order for {symbol}")
                 # ALERT: Send error alert
-                send_email_alert(f"Trade Error: BUY {symbol}", f"Failed to execute buy order for {symbol} at {price}")
-                send_telegram_alert(f"Trade Error: Failed BUY {symbol} at {price}")
+                send_email_alert_async(f"Trade Error: BUY {symbol}", f"Failed to execute buy order for {symbol} at {price}")
+                send_telegram_alert_async(f"Trade Error: Failed BUY {symbol} at {price}")
                 return False
         except Exception as e:
             logger.error(f"Error executing buy order for {symbol}: {e}")
             # ALERT: Send exception alert
-            send_email_alert(f"Exception: BUY {symbol}", str(e))
-            send_telegram_alert(f"Exception: BUY {symbol}: {e}")
+            send_email_alert_async(f"Exception: BUY {symbol}", str(e))
+            send_telegram_alert_async(f"Exception: BUY {symbol}: {e}")
             return False
     
     def execute_sell_order(self, symbol, price, data=None):
         """Execute sell order with flexible stop-loss and take-profit, with alerting."""
         try:
             import MetaTrader5 as mt5
-            stop_loss = self.risk_manager.calculate_stop_loss(price, 'sell', data=data)
-            take_profit = self.risk_manager.calculate_take_profit(price, 'sell', data=data)
+            stop_loss, take_profit = self.risk_manager.calculate_sl_tp(price, 'sell', data=data)
             lot_size = self.risk_manager.calculate_position_size(price, stop_loss)
             # Calculate initial trailing stop
             trailing_stop = None
@@ -418,22 +413,22 @@ class EnhancedTrader:
                 self.risk_manager.add_position(symbol, 'sell', price, lot_size, stop_loss, take_profit, trailing_stop)
                 # ALERT: Send trade execution alert
                 msg = f"SELL EXECUTED: {symbol} at {price}\nSL: {stop_loss}, TP: {take_profit}, Lot: {lot_size}"
-                send_email_alert(f"Trade Executed: SELL {symbol}", msg)
-                send_telegram_alert(msg)
+                send_email_alert_async(f"Trade Executed: SELL {symbol}", msg)
+                send_telegram_alert_async(msg)
                 self.write_trade_history_file()
                 self.write_analytics_file()
                 return True
             else:
                 logger.error(f"Failed to execute sell order for {symbol}")
                 # ALERT: Send error alert
-                send_email_alert(f"Trade Error: SELL {symbol}", f"Failed to execute sell order for {symbol} at {price}")
-                send_telegram_alert(f"Trade Error: Failed SELL {symbol} at {price}")
+                send_email_alert_async(f"Trade Error: SELL {symbol}", f"Failed to execute sell order for {symbol} at {price}")
+                send_telegram_alert_async(f"Trade Error: Failed SELL {symbol} at {price}")
                 return False
         except Exception as e:
             logger.error(f"Error executing sell order for {symbol}: {e}")
             # ALERT: Send exception alert
-            send_email_alert(f"Exception: SELL {symbol}", str(e))
-            send_telegram_alert(f"Exception: SELL {symbol}: {e}")
+            send_email_alert_async(f"Exception: SELL {symbol}", str(e))
+            send_telegram_alert_async(f"Exception: SELL {symbol}: {e}")
             return False
     
     def close_all_positions(self):
@@ -619,8 +614,7 @@ def main() -> None:
         if trader_instance:
             trader_instance.stop()
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Fatal error: %s", e)
         if trader_instance:
             trader_instance.stop()
 
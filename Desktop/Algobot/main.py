@@ -1,7 +1,6 @@
 import time
 import pytz
 import sys
-import traceback
 from datetime import datetime, timedelta
 import MetaTrader5 as mt5
 import pandas as pd
@@ -214,7 +213,7 @@ def ensure_symbol_selected(symbol, max_retries=5, retry_delay=2):
             return True, symbol
             
         except Exception as e:
-            log_step(f"Unexpected error: {str(e)}\n{traceback.format_exc()}", 'error')
+            logger.exception("[Symbol Select] Unexpected error: %s", e)
             time.sleep(retry_delay)
     
     return False, f"Failed to select symbol '{original_symbol}' after {max_retries} attempts"
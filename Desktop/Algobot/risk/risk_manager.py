@@ -1,11 +1,154 @@
 import numpy as np
 import pandas as pd
 from utils.logger import get_logger
-from config import DEFAULT_LOT_SIZE as LOT_SIZE, SLTP_MODE, FIXED_STOP_LOSS_PIPS, FIXED_TAKE_PROFIT_PIPS, ATR_STOP_LOSS_MULTIPLIER, ATR_TAKE_PROFIT_MULTIPLIER, ATR_PERIOD, ATR_MULTIPLIER
+from utils.indicators import calculate_atr
+from config import DEFAULT_LOT_SIZE as LOT_SIZE, CONTRACT_SIZES, DEFAULT_CONTRACT_SIZE, SLTP_MODE, FIXED_STOP_LOSS_PIPS, FIXED_TAKE_PROFIT_PIPS, ATR_STOP_LOSS_MULTIPLIER, ATR_TAKE_PROFIT_MULTIPLIER, ATR_PERIOD, ATR_MULTIPLIER
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 logger = get_logger("RiskManager")
 
+# Fixed SL/TP distances in price units (for XAUUSD, 1 pip = 0.1)
+_PIP_VALUE = 0.1
+_FIXED_SL_DISTANCE = FIXED_STOP_LOSS_PIPS * _PIP_VALUE
+_FIXED_TP_DISTANCE = FIXED_TAKE_PROFIT_PIPS * _PIP_VALUE
+
+
+@dataclass(slots=True)
+class Position:
+    """An open position tracked by the RiskManager."""
+    symbol: str
+    direction: str
+    entry_price: float
+    lot_size: float
+    stop_loss: float
+    take_profit: float
+    trailing_stop: Optional[float] = None
+    entry_time_ns: int = 0  # time.time_ns() at entry; format via entry_time_iso
+    unrealized_pnl: float = 0.0
+    pnl: float = 0.0
+    ticket: Optional[int] = None
+    contract_unit: float = 0.0  # contract size * lot size, fixed for the position's lifetime
+
+    @property
+    def entry_time_iso(self):
+        """Entry time formatted as an ISO-8601 string (local time, second precision)."""
+        return datetime.fromtimestamp(self.entry_time_ns / 1e9).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def contract_size_for(symbol):
+    """Return the contract size (units per lot) for a symbol."""
+    return CONTRACT_SIZES.get(symbol, DEFAULT_CONTRACT_SIZE)
+
+
+def _latest_atr(data):
+    """Return the most recent ATR value for a price DataFrame."""
+    atr_series = calculate_atr(data, ATR_PERIOD)
+    if isinstance(atr_series, pd.Series):
+        return atr_series.iloc[-1]
+    return atr_series[-1]
+
+
+def _stop_loss_percent(self, entry_price, direction, data=None):
+    """Calculate stop loss as a percentage of the entry price."""
+    if direction == 'buy':
+        stop_loss = entry_price * (1 - self.stop_loss_pct)
+    else:
+        stop_loss = entry_price * (1 + self.stop_loss_pct)
+    logger.info("Calculated fallback percent SL for %s at %s: %s", direction, entry_price, stop_loss)
+    return stop_loss
+
+
+def _stop_loss_fixed(self, entry_price, direction, data=None):
+    """Calculate stop loss at a fixed pip distance from the entry price."""
+    if direction == 'buy':
+        stop_loss = entry_price - _FIXED_SL_DISTANCE
+    else:
+        stop_loss = entry_price + _FIXED_SL_DISTANCE
+    logger.info("Calculated fixed SL for %s at %s: %s", direction, entry_price, stop_loss)
+    return stop_loss
+
+
+def _stop_loss_atr(self, entry_price, direction, data=None):
+    """Calculate stop loss from ATR, falling back to percent when no data is given."""
+    if data is None:
+        return _stop_loss_percent(self, entry_price, direction)
+    return _stop_loss_from_atr(entry_price, direction, _latest_atr(data))
+
+
+def _stop_loss_from_atr(entry_price, direction, atr):
+    """Place the stop loss ATR_STOP_LOSS_MULTIPLIER ATRs away from the entry price."""
+    sl_atr = ATR_STOP_LOSS_MULTIPLIER * atr
+    if direction == 'buy':
+        stop_loss = entry_price - sl_atr
+    else:
+        stop_loss = entry_price + sl_atr
+    logger.info("Calculated ATR-based SL for %s at %s: %s", direction, entry_price, stop_loss)
+    return stop_loss
+
+
+def _take_profit_percent(self, entry_price, direction, data=None):
+    """Calculate take profit as a percentage of the entry price."""
+    if direction == 'buy':
+        take_profit = entry_price * (1 + self.take_profit_pct)
+    else:
+        take_profit = entry_price * (1 - self.take_profit_pct)
+    logger.info("Calculated fallback percent TP for %s at %s: %s", direction, entry_price, take_profit)
+    return take_profit
+
+
+def _take_profit_fixed(self, entry_price, direction, data=None):
+    """Calculate take profit at a fixed pip distance from the entry price."""
+    if direction == 'buy':
+        take_profit = entry_price + _FIXED_TP_DISTANCE
+    else:
+        take_profit = entry_price - _FIXED_TP_DISTANCE
+    logger.info("Calculated fixed TP for %s at %s: %s", direction, entry_price, take_profit)
+    return take_profit
+
+
+def _take_profit_atr(self, entry_price, direction, data=None):
+    """Calculate take profit from ATR, falling back to percent when no data is given."""
+    if data is None:
+        return _take_profit_percent(self, entry_price, direction)
+    return _take_profit_from_atr(entry_price, direction, _latest_atr(data))
+
+
+def _take_profit_from_atr(entry_price, direction, atr):
+    """Place the take profit ATR_TAKE_PROFIT_MULTIPLIER ATRs away from the entry price."""
+    tp_atr = ATR_TAKE_PROFIT_MULTIPLIER * atr
+    if direction == 'buy':
+        take_profit = entry_price + tp_atr
+    else:
+        take_profit = entry_price - tp_atr
+    logger.info("Calculated ATR-based TP for %s at %s: %s", direction, entry_price, take_profit)
+    return take_profit
+
+
+def _sl_tp_separate(self, entry_price, direction, data=None):
+    """Calculate (stop_loss, take_profit) with the mode-specific calculators."""
+    return (self.calculate_stop_loss(entry_price, direction, data),
+            self.calculate_take_profit(entry_price, direction, data))
+
+
+def _sl_tp_atr(self, entry_price, direction, data=None):
+    """Calculate (stop_loss, take_profit) from a single ATR evaluation."""
+    if data is None:
+        return (_stop_loss_percent(self, entry_price, direction),
+                _take_profit_percent(self, entry_price, direction))
+    atr = _latest_atr(data)
+    return (_stop_loss_from_atr(entry_price, direction, atr),
+            _take_profit_from_atr(entry_price, direction, atr))
+
+
+# SL/TP implementations keyed by config SLTP_MODE; unknown modes use percent
+_STOP_LOSS_IMPLS = {'fixed': _stop_loss_fixed, 'atr': _stop_loss_atr}
+_TAKE_PROFIT_IMPLS = {'fixed': _take_profit_fixed, 'atr': _take_profit_atr}
+_SL_TP_IMPLS = {'atr': _sl_tp_atr}
+
+
 class RiskManager:
     def __init__(self, 
                  account_balance=10000,
@@ -34,6 +177,21 @@ class RiskManager:
         self.session_start_balance = account_balance
         self.consecutive_losses = 0
         self.circuit_breaker_triggered = False
+        # Column arrays mirroring open_positions (slot i <-> open_positions[i]) for vectorized PnL/risk
+        self._rebuild_position_arrays()
+        # Portfolio risk memo for can_open_position; any PnL/position/balance change marks it dirty
+        self._last_portfolio_risk = 0.0
+        self._portfolio_risk_dirty = True
+        
+    def _rebuild_position_arrays(self):
+        """Rebuild the per-position column arrays after positions are added or removed."""
+        positions = self.open_positions
+        self._symbol_arr = np.array([pos.symbol for pos in positions], dtype=object)
+        self._entry_prices = np.array([pos.entry_price for pos in positions], dtype=np.float64)
+        self._contract_units = np.array([pos.contract_unit for pos in positions], dtype=np.float64)
+        self._direction_sign = np.array([1.0 if pos.direction == 'buy' else -1.0 for pos in positions], dtype=np.float64)
+        self._unrealized_pnl = np.array([pos.unrealized_pnl for pos in positions], dtype=np.float64)
+        self._portfolio_risk_dirty = True
         
     def reset_session(self):
         """Reset session statistics."""
@@ -59,13 +217,11 @@ class RiskManager:
             return False
             
         # Check symbol-specific drawdown
-        symbol_positions = [pos for pos in self.open_positions if pos['symbol'] == symbol]
-        if symbol_positions:
-            symbol_pnl = sum(pos.get('unrealized_pnl', 0) for pos in symbol_positions)
-            symbol_drawdown = abs(symbol_pnl) / self.account_balance
-            if symbol_drawdown > self.max_drawdown_per_symbol:
-                logger.warning(f"Symbol drawdown limit exceeded for {symbol}: {symbol_drawdown:.2%}")
-                return False
+        symbol_pnl = self._unrealized_pnl[self._symbol_arr == symbol].sum()
+        symbol_drawdown = abs(symbol_pnl) / self.account_balance
+        if symbol_drawdown > self.max_drawdown_per_symbol:
+            logger.warning(f"Symbol drawdown limit exceeded for {symbol}: {symbol_drawdown:.2%}")
+            return False
                 
         return True
         
@@ -95,73 +251,10 @@ class RiskManager:
             logger.error(f"Error in dynamic position sizing: {e}")
             return self.lot_size
     
-    def calculate_stop_loss(self, entry_price, direction, data=None):
-        """Calculate stop loss based on config mode: fixed pips or ATR."""
-        if SLTP_MODE == 'fixed':
-            pip_value = 0.1  # For XAUUSD, 1 pip = 0.1
-            sl_pips = FIXED_STOP_LOSS_PIPS * pip_value
-            if direction == 'buy':
-                stop_loss = entry_price - sl_pips
-            else:
-                stop_loss = entry_price + sl_pips
-            logger.info(f"Calculated fixed SL for {direction} at {entry_price}: {stop_loss}")
-            return stop_loss
-        elif SLTP_MODE == 'atr' and data is not None:
-            from utils.indicators import calculate_atr
-            atr_series = calculate_atr(data, ATR_PERIOD)
-            if isinstance(atr_series, pd.Series):
-                atr = atr_series.iloc[-1]
-            else:
-                atr = atr_series[-1]
-            sl_atr = ATR_STOP_LOSS_MULTIPLIER * atr
-            if direction == 'buy':
-                stop_loss = entry_price - sl_atr
-            else:
-                stop_loss = entry_price + sl_atr
-            logger.info(f"Calculated ATR-based SL for {direction} at {entry_price}: {stop_loss}")
-            return stop_loss
-        else:
-            # fallback to percent
-            if direction == 'buy':
-                stop_loss = entry_price * (1 - self.stop_loss_pct)
-            else:
-                stop_loss = entry_price * (1 + self.stop_loss_pct)
-            logger.info(f"Calculated fallback percent SL for {direction} at {entry_price}: {stop_loss}")
-            return stop_loss
-
-    def calculate_take_profit(self, entry_price, direction, data=None):
-        """Calculate take profit based on config mode: fixed pips or ATR."""
-        if SLTP_MODE == 'fixed':
-            pip_value = 0.1  # For XAUUSD, 1 pip = 0.1
-            tp_pips = FIXED_TAKE_PROFIT_PIPS * pip_value
-            if direction == 'buy':
-                take_profit = entry_price + tp_pips
-            else:
-                take_profit = entry_price - tp_pips
-            logger.info(f"Calculated fixed TP for {direction} at {entry_price}: {take_profit}")
-            return take_profit
-        elif SLTP_MODE == 'atr' and data is not None:
-            from utils.indicators import calculate_atr
-            atr_series = calculate_atr(data, ATR_PERIOD)
-            if isinstance(atr_series, pd.Series):
-                atr = atr_series.iloc[-1]
-            else:
-                atr = atr_series[-1]
-            tp_atr = ATR_TAKE_PROFIT_MULTIPLIER * atr
-            if direction == 'buy':
-                take_profit = entry_price + tp_atr
-            else:
-                take_profit = entry_price - tp_atr
-            logger.info(f"Calculated ATR-based TP for {direction} at {entry_price}: {take_profit}")
-            return take_profit
-        else:
-            # fallback to percent
-            if direction == 'buy':
-                take_profit = entry_price * (1 + self.take_profit_pct)
-            else:
-                take_profit = entry_price * (1 - self.take_profit_pct)
-            logger.info(f"Calculated fallback percent TP for {direction} at {entry_price}: {take_profit}")
-            return take_profit
+    # SLTP_MODE is fixed at import time, so bind the matching implementation once
+    calculate_stop_loss = _STOP_LOSS_IMPLS.get(SLTP_MODE, _stop_loss_percent)
+    calculate_take_profit = _TAKE_PROFIT_IMPLS.get(SLTP_MODE, _take_profit_percent)
+    calculate_sl_tp = _SL_TP_IMPLS.get(SLTP_MODE, _sl_tp_separate)
     
     def can_open_position(self, symbol):
         """Check if we can open a new position based on risk rules."""
@@ -183,7 +276,10 @@ class RiskManager:
         # Allow multiple positions per symbol (up to max_positions)
         
         # Check portfolio risk limit
-        current_portfolio_risk = self.calculate_portfolio_risk()
+        if self._portfolio_risk_dirty:
+            self._last_portfolio_risk = self.calculate_portfolio_risk()
+            self._portfolio_risk_dirty = False
+        current_portfolio_risk = self._last_portfolio_risk
         if current_portfolio_risk >= self.max_portfolio_risk:
             logger.warning(f"Cannot open position: Portfolio risk limit ({self.max_portfolio_risk:.2%}) reached")
             return False
@@ -195,115 +291,131 @@ class RiskManager:
         if not self.open_positions:
             return 0.0
         
-        total_risk = 0.0
-        for position in self.open_positions:
-            # Calculate unrealized P&L as percentage of account
-            unrealized_pnl = position.get('unrealized_pnl', 0)
-            risk_pct = abs(unrealized_pnl) / self.account_balance
-            total_risk += risk_pct
-        
-        return total_risk
+        # Sum of unrealized P&L magnitudes as a fraction of the account
+        return float(np.abs(self._unrealized_pnl).sum() / self.account_balance)
     
     def add_position(self, symbol, direction, entry_price, lot_size, stop_loss, take_profit, trailing_stop=None):
         """Add a new position to tracking, with entry time and optional trailing stop"""
-        position = {
-            'symbol': symbol,
-            'direction': direction,
-            'entry_price': entry_price,
-            'lot_size': lot_size,
-            'stop_loss': stop_loss,
-            'take_profit': take_profit,
-            'trailing_stop': trailing_stop,  # NEW: track trailing stop
-            'entry_time': datetime.now().strftime('%Y-%m-%dT%H:%M:%S'),  # Set entry time
-            'unrealized_pnl': 0.0,
-            'pnl': 0.0,
-        }
+        position = Position(
+            symbol=symbol,
+            direction=direction,
+            entry_price=entry_price,
+            lot_size=lot_size,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            trailing_stop=trailing_stop,
+            entry_time_ns=time.time_ns(),
+            contract_unit=contract_size_for(symbol) * lot_size,
+        )
         self.open_positions.append(position)
-        logger.info(f"Added position: {symbol} {direction} {lot_size} lots at {entry_price} (Trailing Stop: {trailing_stop}) Entry Time: {position['entry_time']}")
+        self._rebuild_position_arrays()
+        logger.info(f"Added position: {symbol} {direction} {lot_size} lots at {entry_price} (Trailing Stop: {trailing_stop}) Entry Time: {position.entry_time_iso}")
 
     def update_trailing_stops(self, get_latest_data, update_broker_sl):
         """Recalculate and update trailing stops for all open positions.
         get_latest_data(symbol) should return a DataFrame with latest price data.
         update_broker_sl(symbol, new_sl) should update SL on broker.
         """
-        from utils.indicators import calculate_atr
+        # Local bindings keep the per-position loop on fast local lookups
+        _atr = calculate_atr
+        _mult = ATR_MULTIPLIER
         for position in self.open_positions:
-            symbol = position['symbol']
-            direction = position['direction']
+            symbol = position.symbol
+            direction = position.direction
             data = get_latest_data(symbol)
             if data is None or len(data) < 2:
                 continue
             price = data['close'].iloc[-1]
-            atr = calculate_atr(data, ATR_PERIOD)
+            atr = _atr(data, ATR_PERIOD)
             if isinstance(atr, pd.Series):
                 atr_val = atr.iloc[-1]
             else:
                 atr_val = atr[-1]
             # Calculate new trailing stop
             if direction == 'buy':
-                new_trailing_stop = price - ATR_MULTIPLIER * atr_val
+                new_trailing_stop = price - _mult * atr_val
                 # Only move SL up (never down)
-                if new_trailing_stop > position['stop_loss']:
-                    logger.info(f"Updating trailing stop for {symbol} (buy): {position['stop_loss']} -> {new_trailing_stop}")
-                    position['stop_loss'] = new_trailing_stop
-                    position['trailing_stop'] = new_trailing_stop
+                if new_trailing_stop > position.stop_loss:
+                    logger.info(f"Updating trailing stop for {symbol} (buy): {position.stop_loss} -> {new_trailing_stop}")
+                    position.stop_loss = new_trailing_stop
+                    position.trailing_stop = new_trailing_stop
                     update_broker_sl(symbol, new_trailing_stop)
             else:
-                new_trailing_stop = price + ATR_MULTIPLIER * atr_val
+                new_trailing_stop = price + _mult * atr_val
                 # Only move SL down (never up)
-                if new_trailing_stop < position['stop_loss']:
-                    logger.info(f"Updating trailing stop for {symbol} (sell): {position['stop_loss']} -> {new_trailing_stop}")
-                    position['stop_loss'] = new_trailing_stop
-                    position['trailing_stop'] = new_trailing_stop
+                if new_trailing_stop < position.stop_loss:
+                    logger.info(f"Updating trailing stop for {symbol} (sell): {position.stop_loss} -> {new_trailing_stop}")
+                    position.stop_loss = new_trailing_stop
+                    position.trailing_stop = new_trailing_stop
                     update_broker_sl(symbol, new_trailing_stop)
     
     def remove_position(self, symbol, direction=None):
         """Remove a position from tracking by symbol and (optionally) direction"""
-        before = len(self.open_positions)
-        if direction:
-            self.open_positions = [pos for pos in self.open_positions if not (pos['symbol'] == symbol and pos['direction'] == direction)]
-        else:
-            self.open_positions = [pos for pos in self.open_positions if pos['symbol'] != symbol]
-        after = len(self.open_positions)
+        positions = self.open_positions
+        before = len(positions)
+        # Delete matching slots in place, walking backwards so indices stay valid
+        for i in range(before - 1, -1, -1):
+            pos = positions[i]
+            if pos.symbol == symbol and (not direction or pos.direction == direction):
+                del positions[i]
+        after = len(positions)
+        if after != before:
+            self._rebuild_position_arrays()
         logger.info(f"Removed position: {symbol} {direction if direction else ''} (before: {before}, after: {after})")
     
     def update_position_pnl(self, symbol, current_price):
         """Update unrealized and realized P&L for a position"""
-        for position in self.open_positions:
-            if position['symbol'] == symbol:
-                if position['direction'] == 'buy':
-                    pnl = (current_price - position['entry_price']) * position['lot_size'] * 100000
+        for i, position in enumerate(self.open_positions):
+            if position.symbol == symbol:
+                if position.direction == 'buy':
+                    pnl = (current_price - position.entry_price) * position.contract_unit
                 else:
-                    pnl = (position['entry_price'] - current_price) * position['lot_size'] * 100000
-                position['unrealized_pnl'] = pnl
-                position['pnl'] = pnl
-                logger.info(f"Updated PnL for {symbol} {position['direction']}: {pnl}")
+                    pnl = (position.entry_price - current_price) * position.contract_unit
+                position.unrealized_pnl = pnl
+                position.pnl = pnl
+                self._unrealized_pnl[i] = pnl
+                self._portfolio_risk_dirty = True
+                logger.info("Updated PnL for %s %s: %s", symbol, position.direction, pnl)
                 break
     
+    def update_all_pnl(self, prices):
+        """Update P&L for every open position in one vectorized pass.
+        prices maps symbol -> current price; positions whose symbol is missing keep their last P&L.
+        """
+        if not self.open_positions:
+            return
+        price_array = np.array([prices.get(sym, np.nan) for sym in self._symbol_arr], dtype=np.float64)
+        pnl = self._direction_sign * (price_array - self._entry_prices) * self._contract_units
+        self._unrealized_pnl = np.where(np.isnan(price_array), self._unrealized_pnl, pnl)
+        self._portfolio_risk_dirty = True
+        for position, value in zip(self.open_positions, self._unrealized_pnl.tolist()):
+            position.unrealized_pnl = value
+            position.pnl = value
+    
     def check_stop_loss_take_profit(self, symbol, current_price):
         """Check if position should be closed due to stop loss or take profit"""
         for position in self.open_positions:
-            if position['symbol'] == symbol:
-                if position['direction'] == 'buy':
+            if position.symbol == symbol:
+                if position.direction == 'buy':
                     # Check stop loss (price below stop loss)
-                    if current_price <= position['stop_loss']:
-                        logger.info(f"Stop loss triggered for {symbol} at {current_price}")
+                    if current_price <= position.stop_loss:
+                        logger.info("Stop loss triggered for %s at %s", symbol, current_price)
                         return 'stop_loss'
                     
                     # Check take profit (price above take profit)
-                    if current_price >= position['take_profit']:
-                        logger.info(f"Take profit triggered for {symbol} at {current_price}")
+                    if current_price >= position.take_profit:
+                        logger.info("Take profit triggered for %s at %s", symbol, current_price)
                         return 'take_profit'
                         
                 else:  # short position
                     # Check stop loss (price above stop loss)
-                    if current_price >= position['stop_loss']:
-                        logger.info(f"Stop loss triggered for {symbol} at {current_price}")
+                    if current_price >= position.stop_loss:
+                        logger.info("Stop loss triggered for %s at %s", symbol, current_price)
                         return 'stop_loss'
                     
                     # Check take profit (price below take profit)
-                    if current_price <= position['take_profit']:
-                        logger.info(f"Take profit triggered for {symbol} at {current_price}")
+                    if current_price <= position.take_profit:
+                        logger.info("Take profit triggered for %s at %s", symbol, current_price)
                         return 'take_profit'
         
         return None
@@ -317,9 +429,9 @@ class RiskManager:
         total_pnl = 0.0
         
         for position in self.open_positions:
-            pnl = position.get('unrealized_pnl', 0)
+            pnl = position.unrealized_pnl
             total_pnl += pnl
-            summary += f"  {position['symbol']}: {position['direction']} {position['lot_size']} lots, PnL: ${pnl:.2f}\n"
+            summary += f"  {position.symbol}: {position.direction} {position.lot_size} lots, PnL: ${pnl:.2f}\n"
         
         summary += f"Total PnL: ${total_pnl:.2f}"
         return summary
@@ -327,6 +439,7 @@ class RiskManager:
     def update_account_balance(self, new_balance):
         """Update account balance (e.g., after deposits/withdrawals)"""
         self.account_balance = new_balance
+        self._portfolio_risk_dirty = True
         logger.info(f"Updated account balance: ${new_balance:.2f}")
     
     def get_risk_summary(self):
@@ -7,17 +7,24 @@ class AdvancedStrategy(BaseStrategy):
 
     def run(self):
         print("Running Advanced Strategy (RSI + MA Crossover)")
-        df = self.data.copy()
+        # Work on the close column only instead of copying the whole frame
+        close = self.data['close']
         # Calculate RSI
-        delta = df['close'].diff()
+        delta = close.diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
         rs = gain / loss
-        df['RSI'] = 100 - (100 / (1 + rs))
+        rsi = 100 - (100 / (1 + rs))
         # Calculate MA
-        df['MA'] = df['close'].rolling(window=50).mean()
+        ma = close.rolling(window=50).mean()
         # Example signal: Buy when RSI < 30 and price > MA
-        df['Signal'] = ((df['RSI'] < 30) & (df['close'] > df['MA'])).astype(int)
-        df['Position'] = df['Signal'].diff()
-        print(df[['close', 'RSI', 'MA', 'Signal', 'Position']].tail())
-        # Placeholder: Add trade simulation, performance metrics, and optimization 
\ No newline at end of file
+        signal = ((rsi < 30) & (close > ma)).astype(int)
+        df = pd.DataFrame({
+            'close': close,
+            'RSI': rsi,
+            'MA': ma,
+            'Signal': signal,
+            'Position': signal.diff(),
+        })
+        print(df.tail())
+        # Placeholder: Add trade simulation, performance metrics, and optimization
@@ -12,11 +12,20 @@ class ExamplePluginStrategy(BaseStrategy):
         self.window = window
 
     def generate_signals(self):
-        df = self.data.copy()
-        df['mean'] = df['close'].rolling(window=self.window, min_periods=1).mean()
-        df['std'] = df['close'].rolling(window=self.window, min_periods=1).std()
-        df['Signal'] = 0
-        df['Signal'] = np.where(df['close'] < df['mean'] - df['std'], 1, df['Signal'])
-        df['Signal'] = np.where(df['close'] > df['mean'] + df['std'], -1, df['Signal'])
+        # Build the result from the close column only instead of copying the whole frame
+        close = self.data['close']
+        rolling = close.rolling(window=self.window, min_periods=1)
+        mean = rolling.mean().to_numpy()
+        std = rolling.std().to_numpy()
+        close_arr = close.to_numpy()
+        signal = np.zeros(len(close_arr), dtype=int)
+        signal = np.where(close_arr < mean - std, 1, signal)
+        signal = np.where(close_arr > mean + std, -1, signal)
+        df = pd.DataFrame({
+            'close': close_arr,
+            'mean': mean,
+            'std': std,
+            'Signal': signal,
+        }, index=self.data.index)
         df['Position'] = df['Signal'].diff().fillna(0)
-        return df 
\ No newline at end of file
+        return df
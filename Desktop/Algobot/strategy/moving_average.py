@@ -1,4 +1,5 @@
 from .base import BaseStrategy
+import time
 import pandas as pd
 import numpy as np
 from config import (
@@ -6,7 +7,65 @@ from config import (
     ATR_PERIOD, ATR_MULTIPLIER,
     MAX_RISK_PERCENT, MIN_RISK_PERCENT
 )
-from utils.indicators import calculate_rsi, calculate_atr, calculate_macd
+from utils.indicators import calculate_rsi, calculate_atr, calculate_ema
+from utils.indicators_nb import (
+    NUMBA_AVAILABLE, compute_indicators_batch, make_indicator_kernel, rolling_mean_kernel
+)
+from utils.logger import get_logger
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    from bottleneck import move_mean
+except ImportError:
+    move_mean = None
+
+logger = get_logger("MovingAverageStrategy")
+
+# MACD spans (match calculate_macd defaults)
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+# Output arrays of compute_indicators, in kernel argument order
+INDICATOR_KEYS = ('short_ma', 'long_ma', 'rsi', 'atr', 'ema_fast', 'ema_slow', 'macd', 'macd_signal')
+
+# Price columns copied into the workspace, in kernel argument order
+PRICE_KEYS = ('close', 'high', 'low')
+
+# Reused generate_signals buffers. Prices and indicator outputs are float32
+# (kernel sums still accumulate in float64); the EMA and MACD signal
+# arrays that _update resumes from stay float64 so resuming is exact.
+WORKSPACE_DTYPES = {
+    'close': np.float32,
+    'high': np.float32,
+    'low': np.float32,
+    'short_ma': np.float32,
+    'long_ma': np.float32,
+    'rsi': np.float32,
+    'atr': np.float32,
+    'ema_fast': np.float64,
+    'ema_slow': np.float64,
+    'macd': np.float32,
+    'macd_signal': np.float64,
+    'buy': np.bool_,
+    'sell': np.bool_,
+    'signal': np.int8,
+    'position': np.int8,
+    'trailing_stop': np.float32,
+}
+
+# Price dtype fed to the indicator kernels
+PRICE_DTYPE = np.float32
+
+def _index_values(index):
+    """Index values as an array np.searchsorted compares natively (int64 ns for datetimes)."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8
+    return index.to_numpy()
 
 class MovingAverageStrategy(BaseStrategy):
     def __init__(self, data, short_window=10, long_window=30, lot_size=0.01,
@@ -24,56 +83,117 @@ class MovingAverageStrategy(BaseStrategy):
         self.trend_filter = trend_filter
         self.volatility_filter = volatility_filter
         self.signal_count = 0
-        self.last_trade_time = None
+        # time.monotonic_ns() of the last allowed trade
+        self._last_trade_ns = None
+        # Indicator arrays of the last processed series, see _compute_indicators
+        self._ma_state = None
+        # Indicator and signal buffers reused across calls, see _workspace
+        self._buf = None
+        # Indicator kernel specialised for this strategy's window sizes
+        self._kernel = make_indicator_kernel(
+            short_window, long_window, RSI_PERIOD, ATR_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL
+        )
+        # Higher timeframe trend, recomputed only when that series advances
+        self._ht_cache = {'last_ts': None, 'length': 0, 'ht_index': None, 'trend': None,
+                          'pos_index': None, 'pos_ht_index': None, 'pos': None}
+        # Last generate_signals result, returned again while the data is unchanged
+        self._last_result_key = None
+        self._last_result = None
         # Allow cooldown_period to be set via config, fallback to default
         if cooldown_period is not None:
             self.cooldown_period = cooldown_period
         else:
             self.cooldown_period = pd.Timedelta(minutes=10)  # Default cooldown
+        self._cooldown_ns = pd.Timedelta(self.cooldown_period).value
 
     def _trend_filter(self, df):
         """Only allow trades in the direction of the higher timeframe trend."""
         if not self.trend_filter or self.higher_timeframe_data is None:
-            return pd.Series([True] * len(df), index=df.index)
+            return True  # Disabled: passes every bar
         
-        ht_df = self.higher_timeframe_data.copy()
-        ht_df['HT_Short_MA'] = ht_df['close'].rolling(window=self.short_window, min_periods=1).mean()
-        ht_df['HT_Long_MA'] = ht_df['close'].rolling(window=self.long_window, min_periods=1).mean()
-        ht_trend = ht_df['HT_Short_MA'] > ht_df['HT_Long_MA']
-        # Forward fill to align with lower timeframe
-        ht_trend = ht_trend.reindex(df.index, method='ffill').fillna(False)
-        return ht_trend
-
-    def _volatility_filter(self, df):
+        ht = self.higher_timeframe_data
+        if len(ht) == 0:
+            return np.zeros(len(df), dtype=bool)
+        
+        cache = self._ht_cache
+        if cache['last_ts'] != ht.index[-1] or cache['length'] != len(ht):
+            cache.update(
+                last_ts=ht.index[-1],
+                length=len(ht),
+                ht_index=ht.index,
+                trend=self._moving_average(ht['close'], self.short_window)
+                      > self._moving_average(ht['close'], self.long_window),
+            )
+        # Forward fill: each bar takes the last higher timeframe bar at or
+        # before it. The position map only depends on the two indexes.
+        if cache['pos_index'] is not df.index or cache['pos_ht_index'] is not cache['ht_index']:
+            pos = np.searchsorted(_index_values(cache['ht_index']), _index_values(df.index), side='right') - 1
+            cache.update(pos_index=df.index, pos_ht_index=cache['ht_index'], pos=pos)
+        pos = cache['pos']
+        return np.where(pos >= 0, cache['trend'][pos], False)
+
+    @staticmethod
+    def _moving_average(close, window):
+        """
+        Rolling mean of a close Series with min_periods=1, as an ndarray.
+        Uses the compiled kernel, then bottleneck, then pandas.
+        """
+        if NUMBA_AVAILABLE:
+            out = np.empty(len(close), dtype=PRICE_DTYPE)
+            rolling_mean_kernel(close.to_numpy(dtype=PRICE_DTYPE), window, out)
+            return out
+        if move_mean is not None:
+            return move_mean(close.to_numpy(dtype=np.float64), window, min_count=1)
+        return close.rolling(window=window, min_periods=1).mean().to_numpy()
+
+    def _volatility_filter(self, df, atr):
         """Avoid trading during low volatility (ATR below threshold)."""
         if not self.volatility_filter:
-            return pd.Series([True] * len(df), index=df.index)
+            return True  # Disabled: passes every bar
         
-        atr = calculate_atr(df, ATR_PERIOD)
-        threshold = atr.mean() * 0.7  # Configurable threshold
+        # ATR is NaN until its window fills; those bars never pass
+        if np.isnan(atr).all():
+            return np.zeros(len(df), dtype=bool)
+        threshold = np.nanmean(atr, dtype=np.float64) * 0.7  # Configurable threshold
         return atr > threshold
 
-    def _macd_confirmation(self, df):
+    def _macd_confirmation(self, df, macd, macd_signal):
         """MACD confirmation for trend direction."""
         if not self.use_macd:
-            return pd.Series([True] * len(df), index=df.index)
+            return True  # Disabled: passes every bar
         
-        macd, signal, _ = calculate_macd(df['close'])
-        return macd > signal
+        return macd > macd_signal
 
-    def _atr_band_confirmation(self, df):
+    def _atr_band_confirmation(self, close, atr):
         """ATR band confirmation for volatility breakouts."""
         if not self.use_atr_band:
-            return pd.Series([True] * len(df), index=df.index)
+            return True  # Disabled: passes every bar
         
-        atr = calculate_atr(df, ATR_PERIOD)
-        upper_band = df['close'] + atr * ATR_MULTIPLIER
-        lower_band = df['close'] - atr * ATR_MULTIPLIER
-        return (df['close'] > upper_band) | (df['close'] < lower_band)
-
-    def _rsi_confirmation(self, df):
-        """RSI confirmation for overbought/oversold conditions."""
-        rsi = calculate_rsi(df['close'], RSI_PERIOD)
+        if ne is not None:
+            return ne.evaluate(
+                '(close > close + atr * mult) | (close < close - atr * mult)',
+                local_dict={'close': close, 'atr': atr, 'mult': ATR_MULTIPLIER}
+            )
+        upper_band = close + atr * ATR_MULTIPLIER
+        lower_band = close - atr * ATR_MULTIPLIER
+        return (close > upper_band) | (close < lower_band)
+
+    @staticmethod
+    def _and_into(out, masks):
+        """
+        AND boolean masks into out in place, in one fused pass when numexpr
+        is installed. A mask of True (a disabled filter) is skipped.
+        """
+        masks = [mask for mask in masks if mask is not True]
+        if ne is not None and masks:
+            names = {f'm{i}': mask for i, mask in enumerate(masks)}
+            ne.evaluate(' & '.join(['out', *names]), local_dict={'out': out, **names}, out=out)
+            return
+        for mask in masks:
+            out &= mask
+
+    def _rsi_confirmation(self, rsi):
+        """RSI confirmation for overbought/oversold conditions, from the computed RSI array."""
         # Buy when RSI < 70 (not overbought), Sell when RSI > 30 (not oversold)
         buy_condition = rsi < RSI_OVERBOUGHT
         sell_condition = rsi > RSI_OVERSOLD
@@ -83,86 +203,338 @@ class MovingAverageStrategy(BaseStrategy):
         """Check overtrading limit and cooldown period."""
         # Overtrading limit
         if self.signal_count >= self.overtrading_limit:
-            print(f"[DEBUG] Overtrading limit reached: {self.signal_count} >= {self.overtrading_limit}")
+            logger.debug("Overtrading limit reached: %d >= %d", self.signal_count, self.overtrading_limit)
             return False
         
         # Cooldown period
-        if self.last_trade_time is not None:
-            time_since_last_trade = pd.Timestamp.now() - self.last_trade_time
-            if time_since_last_trade < self.cooldown_period:
-                print(f"[DEBUG] Cooldown active: {time_since_last_trade} < {self.cooldown_period}")
+        now = time.monotonic_ns()
+        if self._last_trade_ns is not None:
+            elapsed_ns = now - self._last_trade_ns
+            if elapsed_ns < self._cooldown_ns:
+                logger.debug("Cooldown active: %.1fs < %.1fs", elapsed_ns / 1e9, self._cooldown_ns / 1e9)
                 return False
         
         self.signal_count += 1
-        self.last_trade_time = pd.Timestamp.now()
+        self._last_trade_ns = now
         return True
 
-    def _calculate_trailing_stop(self, df, position_type):
-        """Calculate trailing stop based on ATR."""
-        atr = calculate_atr(df, ATR_PERIOD)
-        if position_type == 'buy':
-            return df['close'] - (atr * 2)  # 2x ATR below price
-        else:
-            return df['close'] + (atr * 2)  # 2x ATR above price
+    def reset_trade_limits(self):
+        """Clear the overtrading count and cooldown, as a freshly built instance has them."""
+        self.signal_count = 0
+        self._last_trade_ns = None
+
+    @staticmethod
+    def _calculate_trailing_stop(close, atr, signal):
+        """Trailing stop 2x ATR below buy signals and above sell signals, NaN elsewhere."""
+        return np.where(signal == 1, close - 2.0 * atr,
+                        np.where(signal == -1, close + 2.0 * atr, np.nan))
+
+    def _load_prices(self, df, ws, start=0):
+        """
+        Copy df's price columns from row start onwards into the workspace,
+        as C-contiguous float32, and return them in kernel argument order.
+        """
+        for key in PRICE_KEYS:
+            ws[key][start:] = df[key].to_numpy()[start:]
+        return tuple(ws[key] for key in PRICE_KEYS)
+
+    def _workspace(self, n):
+        """
+        Length-n views into the reused price, indicator and signal buffers.
+        Buffers grow geometrically and keep their price and indicator
+        history so _update can extend it in place.
+        """
+        buf = self._buf
+        capacity = len(buf['signal']) if buf is not None else 0
+        if buf is None or capacity < n:
+            capacity = max(n, 2 * capacity)
+            grown = {key: np.empty(capacity, dtype=dtype) for key, dtype in WORKSPACE_DTYPES.items()}
+            if buf is not None:
+                for key in PRICE_KEYS + INDICATOR_KEYS:
+                    grown[key][:len(buf[key])] = buf[key]
+            self._buf = buf = grown
+        return {key: arr[:n] for key, arr in buf.items()}
+
+    def _bootstrap(self, df, ws):
+        """Full indicator computation over df into the workspace ws."""
+        prices = self._load_prices(df, ws)
+        if NUMBA_AVAILABLE:
+            self._kernel(*prices, 0, *(ws[key] for key in INDICATOR_KEYS))
+            return
+        
+        close = df['close']
+        ema_fast = calculate_ema(close, MACD_FAST)
+        ema_slow = calculate_ema(close, MACD_SLOW)
+        macd = ema_fast - ema_slow
+        ws['short_ma'][:] = self._moving_average(close, self.short_window)
+        ws['long_ma'][:] = self._moving_average(close, self.long_window)
+        ws['rsi'][:] = calculate_rsi(close, RSI_PERIOD).to_numpy()
+        ws['atr'][:] = calculate_atr(df, ATR_PERIOD).to_numpy()
+        ws['ema_fast'][:] = ema_fast.to_numpy()
+        ws['ema_slow'][:] = ema_slow.to_numpy()
+        ws['macd'][:] = macd.to_numpy()
+        ws['macd_signal'][:] = calculate_ema(macd, MACD_SIGNAL).to_numpy()
+
+    def _update(self, df, ws, state):
+        """
+        Extend the indicators from the previous call to the bars appended
+        since. Returns False when df does not continue the cached series
+        from the same first bar.
+        """
+        index = df.index
+        last_ts = state['last_ts']
+        # The previous last bar may still have been forming, so restart there
+        start = index.searchsorted(last_ts)
+        if start >= len(index) or index[start] != last_ts:
+            return False
+        # Window sums are re-seeded from df, which needs a full window of history
+        if start < max(self.long_window, self.short_window, RSI_PERIOD, ATR_PERIOD):
+            return False
+        # df must start at the cached series' first bar: the warm-up rows and
+        # the EMAs depend on where the series starts, so a window that slid
+        # forward needs a full pass to match a fresh compute
+        if state['last_n'] - 1 != start or state['index'][0] != index[0]:
+            return False
+        
+        # Only the new bars are converted; earlier prices are already in the workspace
+        prices = self._load_prices(df, ws, start)
+        self._kernel(*prices, start, *(ws[key] for key in INDICATOR_KEYS))
+        return True
+
+    def _compute_indicators(self, df):
+        """
+        Compute MA, RSI, ATR and MACD for df into the workspace and return it.
+        Only bars appended since the previous call are computed when df
+        extends the last processed series; otherwise does a full pass (one
+        fused compiled pass when Numba is installed, pandas otherwise).
+        """
+        ws = self._extend_indicators(df)
+        if ws is None:
+            ws = self._full_indicators(df)
+        return ws
+
+    def _extend_indicators(self, df):
+        """
+        Workspace for df with the indicators extended by _update, or None
+        when df does not continue the last processed series.
+        """
+        n = len(df)
+        if n == 0 or self._ma_state is None:
+            return None
+        ws = self._workspace(n)
+        if not self._update(df, ws, self._ma_state):
+            return None
+        self._remember_series(df)
+        return ws
+
+    def _full_indicators(self, df):
+        """Workspace for df with the indicators computed from the first bar."""
+        n = len(df)
+        ws = self._workspace(n)
+        if n == 0:
+            return ws
+        self._bootstrap(df, ws)
+        self._remember_series(df)
+        return ws
+
+    def _remember_series(self, df):
+        """Record df as the series held in the workspace for _update."""
+        self._ma_state = {
+            'last_ts': df.index[-1],
+            'last_n': len(df),
+            'index': df.index,
+        }
 
     def generate_signals(self):
         """Generate trading signals using all enabled filters for high-probability entries."""
-        df = self.data.copy()
+        df = self.data
         
-        # Calculate moving averages
-        df['Short_MA'] = df['close'].rolling(window=self.short_window, min_periods=1).mean()
-        df['Long_MA'] = df['close'].rolling(window=self.long_window, min_periods=1).mean()
+        # Same series as last time: nothing to recompute
+        key = self._result_key(df)
+        if key is not None and key == self._last_result_key:
+            return self._last_result
         
-        # Calculate RSI
-        df['RSI'] = calculate_rsi(df['close'], RSI_PERIOD)
-        
-        # Calculate ATR
-        df['ATR'] = calculate_atr(df, ATR_PERIOD)
+        # Calculate moving averages, RSI, ATR and MACD
+        return self._cache_signals(df, self._compute_indicators(df))
+
+    def _cache_signals(self, df, ws):
+        """Signals frame from the computed workspace, kept as the cached result."""
+        result = self._signals_from_workspace(df, ws)
+        self._last_result_key = self._result_key(df)
+        self._last_result = result
+        return result
+
+    @staticmethod
+    def _result_key(df):
+        """Cheap identity of df for the result cache (None when empty)."""
+        if len(df) == 0:
+            return None
+        return (id(df), len(df), df.index[-1], df['close'].iat[-1])
+
+    def get_latest_signal(self):
+        """
+        Signal on the latest bar (1 buy, -1 sell, 0 none) after the
+        overtrading limit and cooldown. A non-zero signal that passes
+        counts as a trade for both.
+        """
+        signals = self.generate_signals()
+        if signals.empty:
+            return 0
         
-        # Initialize signals
-        df['Signal'] = 0
-        df['Position'] = 0
-        df['Trailing_Stop'] = np.nan
+        signal = int(signals['Signal'].iat[-1])
+        if signal != 0 and not self._can_trade():
+            signal = 0
+        self.last_signal = signal
+        return signal
+
+    @classmethod
+    def generate_signals_batch(cls, symbol_data, **kwargs):
+        """
+        Generate signals for several symbols, computing their indicators in
+        one parallel compiled pass.
+
+        Args:
+            symbol_data: dict of symbol -> OHLC DataFrame
+            **kwargs: strategy parameters shared by every symbol
+
+        Returns:
+            dict of symbol -> signals DataFrame (as from generate_signals)
+        """
+        strategies = {symbol: cls(data, **kwargs) for symbol, data in symbol_data.items()}
+        return cls.generate_signals_for(strategies)
+
+    @staticmethod
+    def generate_signals_for(strategies):
+        """
+        generate_signals for existing instances, e.g. one per timeframe of a
+        symbol, computing their indicators in one parallel compiled pass.
+
+        Instances whose data is unchanged since their last call reuse their
+        cached result, and instances whose data extends their last series
+        only compute the new bars (_update). The rest need a full pass: they
+        are batched, except those whose windows differ from the rest, or all
+        of them when Numba is unavailable or only one needs it.
+
+        Args:
+            strategies: dict of key -> MovingAverageStrategy, data already set
+
+        Returns:
+            dict of key -> signals DataFrame (as from generate_signals)
+        """
+        results = {}
+        pending = {}
+        for key, strategy in strategies.items():
+            result_key = strategy._result_key(strategy.data)
+            if result_key is not None and result_key == strategy._last_result_key:
+                results[key] = strategy._last_result
+            else:
+                pending[key] = strategy
+        full = {}
+        for key, strategy in pending.items():
+            ws = strategy._extend_indicators(strategy.data)
+            if ws is None:
+                full[key] = strategy
+            else:
+                results[key] = strategy._cache_signals(strategy.data, ws)
+        if not full:
+            return results
+
+        first = next(iter(full.values()))
+        windows = (first.short_window, first.long_window)
+        batch = {key: strategy for key, strategy in full.items()
+                 if (strategy.short_window, strategy.long_window) == windows}
+        if not NUMBA_AVAILABLE or len(batch) < 2:
+            batch = {}
+        for key, strategy in full.items():
+            if key not in batch:
+                results[key] = strategy._cache_signals(strategy.data, strategy._full_indicators(strategy.data))
+        if not batch:
+            return results
+
+        # Pack prices into (strategies, bars) rows; shorter rows are padded
+        lengths = np.array([len(strategy.data) for strategy in batch.values()], dtype=np.int64)
+        shape = (len(batch), int(lengths.max()))
+        prices = {col: np.zeros(shape, dtype=PRICE_DTYPE) for col in PRICE_KEYS}
+        for row, strategy in enumerate(batch.values()):
+            for col, values in prices.items():
+                values[row, :lengths[row]] = strategy.data[col].to_numpy(dtype=PRICE_DTYPE)
+        out = {key: np.empty(shape, dtype=WORKSPACE_DTYPES[key]) for key in INDICATOR_KEYS}
+        compute_indicators_batch(
+            prices['close'], prices['high'], prices['low'], lengths,
+            windows[0], windows[1], RSI_PERIOD, ATR_PERIOD,
+            MACD_FAST, MACD_SLOW, MACD_SIGNAL,
+            *(out[key] for key in INDICATOR_KEYS)
+        )
+
+        for row, (key, strategy) in enumerate(batch.items()):
+            n = lengths[row]
+            df = strategy.data
+            ws = strategy._workspace(n)
+            for col in PRICE_KEYS:
+                ws[col][:] = prices[col][row, :n]
+            for col in INDICATOR_KEYS:
+                ws[col][:] = out[col][row, :n]
+            if n > 0:
+                strategy._remember_series(df)
+            # Same result cache as generate_signals, so get_latest_signal reuses it
+            results[key] = strategy._cache_signals(df, ws)
+        return results
+
+    def _signals_from_workspace(self, df, ws):
+        """Apply filters and build the signals frame from computed indicators."""
+        buy_signal = ws['buy']
+        sell_signal = ws['sell']
 
         # Core MA signals
-        ma_buy = (df['Short_MA'] > df['Long_MA'])
-        ma_sell = (df['Short_MA'] < df['Long_MA'])
+        np.greater(ws['short_ma'], ws['long_ma'], out=buy_signal)
+        np.less(ws['short_ma'], ws['long_ma'], out=sell_signal)
 
         # RSI confirmation
-        rsi_buy, rsi_sell = self._rsi_confirmation(df)
-
-        # Trend filter
-        trend = self._trend_filter(df)
-        # Volatility filter
-        volatility = self._volatility_filter(df)
-        # MACD confirmation
-        macd_conf = self._macd_confirmation(df)
-        # ATR band confirmation
-        atr_band = self._atr_band_confirmation(df)
-
-        # Combine all filters for buy/sell
-        buy_signal = ma_buy & rsi_buy & trend & volatility & macd_conf & atr_band
-        sell_signal = ma_sell & rsi_sell & trend & volatility & macd_conf & atr_band
-
-        # Apply signals with overtrading/cooldown check
-        if self._can_trade():
-            df.loc[buy_signal, 'Signal'] = 1
-            df.loc[sell_signal, 'Signal'] = -1
+        rsi_buy, rsi_sell = self._rsi_confirmation(ws['rsi'])
+
+        # Optional filters are only computed and applied when enabled
+        filters = []
+        if self.trend_filter:
+            filters.append(self._trend_filter(df))
+        if self.volatility_filter:
+            filters.append(self._volatility_filter(df, ws['atr']))
+        if self.use_macd:
+            filters.append(self._macd_confirmation(df, ws['macd'], ws['macd_signal']))
+        if self.use_atr_band:
+            filters.append(self._atr_band_confirmation(ws['close'], ws['atr']))
+        self._and_into(buy_signal, [rsi_buy, *filters])
+        self._and_into(sell_signal, [rsi_sell, *filters])
+
+        # Signals for every bar; the overtrading/cooldown check only gates
+        # acting on the latest one, see get_latest_signal
+        signal = ws['signal']
+        signal.fill(0)
+        signal[buy_signal] = 1
+        signal[sell_signal] = -1
 
         # Set Position column based on signals
-        df['Position'] = 0
-        df.loc[buy_signal, 'Position'] = 1
-        df.loc[sell_signal, 'Position'] = -1
+        position = ws['position']
+        position.fill(0)
+        position[buy_signal] = 1
+        position[sell_signal] = -1
 
         # Calculate trailing stops based on ATR
-        df.loc[df['Signal'] == 1, 'Trailing_Stop'] = self._calculate_trailing_stop(df[df['Signal'] == 1], 'buy')
-        df.loc[df['Signal'] == -1, 'Trailing_Stop'] = self._calculate_trailing_stop(df[df['Signal'] == -1], 'sell')
-
-        # Store the last signal
-        if len(df) > 0:
-            self.last_signal = df['Signal'].iloc[-1]
+        trailing_stop = ws['trailing_stop']
+        trailing_stop[:] = self._calculate_trailing_stop(ws['close'], ws['atr'], signal)
 
-        return df
+        # Only now materialise the output columns next to the price data.
+        # The workspace columns are copied out since the buffers are reused
+        # by the next call; the price columns are shared with self.data.
+        columns = pd.DataFrame({
+            'Short_MA': ws['short_ma'],
+            'Long_MA': ws['long_ma'],
+            'RSI': ws['rsi'],
+            'ATR': ws['atr'],
+            'Signal': signal,
+            'Position': position,
+            'Trailing_Stop': trailing_stop,
+        }, index=df.index, copy=True)
+        return pd.concat([df, columns], axis=1, copy=False)
 
     def get_parameters(self):
         """Return current strategy parameters."""
@@ -10,9 +10,11 @@ Features:
 """
 import time
 import logging
+import functools
+import collections
 import MetaTrader5 as mt5
 import pandas as pd
-from typing import Optional, Dict, Any, List, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union, NamedTuple
 from datetime import datetime, timedelta
 from strategy.moving_average import MovingAverageStrategy
 from config import (
@@ -26,8 +28,9 @@ from config import (
 )
 from strategy import get_strategy_registry
 from execution.trade_manager import TradeManager
-from data import fetch_mt5_data, login_mt5, logout_mt5
-from utils.indicators import calculate_rsi, calculate_atr
+from data import TIMEFRAME_CODES, fetch_mt5_data_multi, login_mt5, logout_mt5
+from utils.indicators import calculate_rsi
+from utils.indicators_nb import NUMBA_AVAILABLE, latest_atr
 from utils.logger import get_logger
 import os
 import numpy as np
@@ -35,6 +38,104 @@ os.environ['LOG_FORMAT'] = 'json'  # Enable structured JSON logging for this scr
 
 logger = get_logger("StrategyExecutor")
 
+# MT5 timeframe mapping (read-only, shared with data.fetch_mt5)
+TIMEFRAME_MAPPING = TIMEFRAME_CODES
+
+class SymbolSelectionError(RuntimeError):
+    """Raised when a symbol can't be selected in Market Watch after all retries"""
+    pass
+
+class _RateLimitedLogger:
+    """
+    Error logging for errors that can repeat every loop. A traceback is only
+    formatted on the first occurrence of a key, every `every`-th one, or once
+    `interval` seconds have passed since the last; otherwise just the message
+    is logged.
+    """
+    def __init__(self, logger: logging.Logger, every: int = 10, interval: float = 60.0):
+        self._logger = logger
+        self._every = every
+        self._interval = interval
+        self._counts: collections.Counter = collections.Counter()
+        self._last_trace: Dict[str, float] = {}
+    
+    def error(self, key: str, msg: str, exc_info: bool = True) -> None:
+        self._counts[key] += 1
+        count = self._counts[key]
+        now = time.monotonic()
+        last = self._last_trace.get(key)
+        with_trace = exc_info and (last is None or count % self._every == 0 or now - last >= self._interval)
+        if with_trace:
+            self._last_trace[key] = now
+        if count > 1:
+            msg = f"{msg} (seen {count} times)"
+        self._logger.error(msg, exc_info=with_trace)
+
+_error_log = _RateLimitedLogger(logger)
+
+# Seconds a cached symbol lookup stays valid
+SYMBOL_CACHE_TTL = 30
+
+# Bar length in seconds per timeframe, used to schedule the main loop
+TIMEFRAME_SECONDS = {'M1': 60, 'M5': 300, 'M15': 900, 'M30': 1800, 'H1': 3600, 'H4': 14400, 'D1': 86400}
+BAR_CLOSE_GRACE = 1.0  # Seconds to wait past a bar close so MT5 has the new bar
+MIN_LOOP_SLEEP = 0.5
+MAX_LOOP_SLEEP = 60  # Upper bound, covers broker clocks not aligned to UTC boundaries
+
+def _seconds_until_next_bar(timeframes, now: float) -> float:
+    """Sleep until the earliest upcoming bar close across timeframes, clamped to the loop bounds."""
+    periods = [TIMEFRAME_SECONDS[tf] for tf in timeframes if tf in TIMEFRAME_SECONDS]
+    if not periods:
+        return MIN_LOOP_SLEEP
+    wait = min(period - now % period for period in periods) + BAR_CLOSE_GRACE
+    return min(MAX_LOOP_SLEEP, max(MIN_LOOP_SLEEP, wait))
+
+class SymbolSnapshot(NamedTuple):
+    """Cached result of the MT5 symbol lookups used on every loop."""
+    visible: bool
+    point: float
+    tick_time: Optional[int]
+
+@functools.lru_cache(maxsize=256)
+def _symbol_info_cached(symbol: str, epoch: int) -> Optional[SymbolSnapshot]:
+    """
+    symbol_info/symbol_info_tick for symbol, cached per TTL bucket.
+    epoch is int(time.time() // SYMBOL_CACHE_TTL), so entries expire when it rolls over.
+    """
+    info = mt5.symbol_info(symbol)  # type: ignore[attr-defined]
+    if info is None:
+        return None
+    tick = mt5.symbol_info_tick(symbol)  # type: ignore[attr-defined]
+    return SymbolSnapshot(info.visible, info.point, tick.time if tick is not None else None)
+
+def _symbol_epoch() -> int:
+    """Current TTL bucket for _symbol_info_cached."""
+    return int(time.time() // SYMBOL_CACHE_TTL)
+
+def _latest_atr(df, period):
+    """
+    ATR of the last bar, same as calculate_atr(df, period).iloc[-1], from
+    only the last period + 1 bars. df must hold at least period bars.
+    """
+    if NUMBA_AVAILABLE:
+        return latest_atr(
+            df['high'].to_numpy(dtype=np.float64),
+            df['low'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            period,
+        )
+    
+    k = min(len(df), period + 1)
+    high = df['high'].to_numpy(dtype=np.float64)[-k:]
+    low = df['low'].to_numpy(dtype=np.float64)[-k:]
+    close = df['close'].to_numpy(dtype=np.float64)[-k:]
+    
+    # True range; the first bar has no previous close
+    tr = high - low
+    prev_close = close[:-1]
+    tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+    return float(tr[-period:].mean())
+
 class StrategyExecutor:
     """
     Main strategy executor class with enhanced error handling and symbol selection.
@@ -42,9 +143,9 @@ class StrategyExecutor:
     Attributes:
         symbols (List[str]): List of trading symbols
         timeframe (str): Trading timeframe
-        strategies (Dict[str, Any]): Dictionary of strategy instances
+        strategies (Dict[Tuple[str, str, str], Any]): Strategy instances by (symbol, timeframe, strategy name)
         trade_manager (Optional[TradeManager]): Trade manager instance
-        last_bar_time (Dict[str, datetime]): Last processed bar time for each symbol
+        last_bar_time (Dict[Tuple[str, str], datetime]): Last processed bar time for each (symbol, timeframe)
         max_retries (int): Maximum number of retries for operations
         retry_delay (int): Delay between retries in seconds
     """
@@ -53,12 +154,27 @@ class StrategyExecutor:
         """Initialize the StrategyExecutor with configuration from config.py"""
         self.symbols = SYMBOLS.copy()
         self.timeframes = TIMEFRAMES.copy()  # Use all configured timeframes
-        self.strategies: Dict[str, Any] = {}
+        self.strategies: Dict[Tuple[str, str, str], Any] = {}  # (symbol, timeframe, strategy name) -> instance
+        self._strategy_cls_cache: Dict[str, Tuple[str, Any]] = {}  # symbol -> (strategy name, class)
+        # Constructor arguments shared by every strategy instance, built once
+        self._base_params: Dict[str, Any] = dict(DEFAULT_STRATEGY_PARAMS)
+        self._base_params["lot_size"] = DEFAULT_LOT_SIZE
         self.trade_manager: Optional[TradeManager] = None
-        self.last_bar_time: Dict[str, datetime] = {}
+        self.last_bar_time: Dict[Tuple[str, str], datetime] = {}
+        self._last_bar_close: Dict[Tuple[str, str], float] = {}  # Close of that bar, which moves while it forms
         self.max_retries = 3
         self.retry_delay = 2  # seconds
         self.selected_symbols = set()  # Cache for selected symbols
+        # Read-only snapshot of selected_symbols for the hot path, swapped whole on change
+        self._selected_frozen: frozenset = frozenset()
+        # Timeframes resolved to MT5 constants once, as (name, code) pairs
+        self._tf_pairs: List[Tuple[str, int]] = []
+        for tf in self.timeframes:
+            if tf in TIMEFRAME_MAPPING:
+                self._tf_pairs.append((tf, TIMEFRAME_MAPPING[tf]))
+            else:
+                logger.error(f"Unknown timeframe {tf}, skipping")
+        self._tf_codes: Tuple[int, ...] = tuple(tf_code for _, tf_code in self._tf_pairs)
         
     def _validate_symbol(self, symbol: str) -> bool:
         """
@@ -72,6 +188,11 @@ class StrategyExecutor:
         """
         if not symbol or not isinstance(symbol, str):
             return False
+        
+        # Recently seen visible with a tick: nothing to do
+        snapshot = _symbol_info_cached(symbol, _symbol_epoch())
+        if snapshot is not None and snapshot.visible and snapshot.tick_time is not None:
+            return True
             
         # Try to select the symbol
         if not mt5.symbol_select(symbol, True):  # type: ignore[attr-defined]
@@ -97,6 +218,23 @@ class StrategyExecutor:
             
         return True
         
+    def _validate_symbol_fast(self, symbol_info: Any) -> bool:
+        """
+        Validate a symbol from an already fetched symbol_info record
+        (e.g. from mt5.symbols_get()), so only the tick check calls MT5.
+        
+        Args:
+            symbol_info: MT5 SymbolInfo record
+            
+        Returns:
+            bool: True if symbol is visible, tradable and has tick data
+        """
+        if not symbol_info.visible:
+            return False
+        if symbol_info.trade_mode == mt5.SYMBOL_TRADE_MODE_DISABLED:  # type: ignore[attr-defined]
+            return False
+        return mt5.symbol_info_tick(symbol_info.name) is not None  # type: ignore[attr-defined]
+        
     def get_available_symbol(self) -> Optional[str]:
         """
         Find and return the first available symbol from the priority list.
@@ -117,12 +255,19 @@ class StrategyExecutor:
                 logger.warning(f"Using configured symbol: {symbol}")
                 return symbol
         
-        # As a last resort, try to find any available symbol
+        # As a last resort, try to find any available symbol. Symbols already in
+        # Market Watch are checked from the fields symbols_get returned, then the
+        # rest of the first 100 go through the full select-and-check.
         try:
             all_symbols = mt5.symbols_get()  # type: ignore[attr-defined]
             if all_symbols:
+                visible = [symbol for symbol in all_symbols if symbol.visible][:100]
+                for symbol in visible:
+                    if self._validate_symbol_fast(symbol):
+                        logger.warning(f"Using available symbol: {symbol.name}")
+                        return symbol.name
                 for symbol in all_symbols[:100]:  # Limit to first 100 to avoid timeout
-                    if self._validate_symbol(symbol.name):
+                    if not symbol.visible and self._validate_symbol(symbol.name):
                         logger.warning(f"Using available symbol: {symbol.name}")
                         return symbol.name
         except Exception as e:
@@ -185,8 +330,11 @@ class StrategyExecutor:
             # Initialize strategies
             logger.info("📈 Initializing trading strategies...")
             try:
-                # Don't initialize strategies here - they will be created with actual data in process_symbol
+                # Strategy instances are created with actual data in process_symbol and then reused
                 self.strategies = {}
+                self._strategy_cls_cache = {}
+                strategy_name, _ = self._strategy_cls(available_symbol)
+                logger.info(f"Using {strategy_name} for {available_symbol}")
                 logger.info("✅ Successfully initialized trading strategies container")
             except Exception as e:
                 logger.error(f"❌ Failed to initialize strategies: {str(e)}")
@@ -207,17 +355,12 @@ class StrategyExecutor:
         Returns a value between 0.1 and 1.0
         """
         try:
-            # Calculate ATR
-            atr = calculate_atr(df, ATR_PERIOD)
-            # Fix: ensure atr is a pandas Series
-            if isinstance(atr, np.ndarray):
-                atr = pd.Series(atr, index=df.index)
-            if atr is None or len(atr) < 2:
+            if len(df) < max(2, ATR_PERIOD):
                 return 1.0
                 
             # Calculate ATR as percentage of price
-            current_atr = atr.iloc[-1]
-            current_price = df['close'].iloc[-1]
+            current_atr = _latest_atr(df, ATR_PERIOD)
+            current_price = df['close'].iat[-1]
             atr_pct = (current_atr / current_price) * 100
             
             # Calculate volatility adjustment
@@ -233,10 +376,105 @@ class StrategyExecutor:
                 
             return adjustment
             
+        except TypeError:
+            # Usually a compiled kernel rejecting its inputs, a bug rather than
+            # bad data: keep the traceback instead of a one-line error
+            logger.exception("Error calculating volatility adjustment")
+            return 1.0
         except Exception as e:
             logger.error(f"Error calculating volatility adjustment: {str(e)}")
             return 1.0
     
+    def _strategy_cls(self, symbol: str) -> Tuple[str, Any]:
+        """
+        Strategy name and class configured for a symbol, resolved once.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Tuple[str, Any]: (strategy name, strategy class)
+        """
+        cached = self._strategy_cls_cache.get(symbol)
+        if cached is None:
+            registry = get_strategy_registry()
+            strategy_name = STRATEGY_SELECTION.get(symbol, "MovingAverageStrategy")
+            strategy_cls = registry.get(strategy_name)
+            if not strategy_cls:
+                logger.warning(f"Strategy '{strategy_name}' not found, using MovingAverageStrategy.")
+                strategy_cls = MovingAverageStrategy
+            cached = self._strategy_cls_cache[symbol] = (strategy_name, strategy_cls)
+        return cached
+    
+    def _fetch_bars(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch the latest 300 bars for every timeframe in one batched request,
+        retrying only the timeframes that came back empty.
+        
+        Args:
+            symbol: Symbol to fetch
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Bars by timeframe string; timeframes that
+            failed every attempt are left out
+        """
+        bars: Dict[str, pd.DataFrame] = {}
+        pending = self._tf_pairs
+        codes = self._tf_codes
+        for attempt in range(self.max_retries):
+            try:
+                fetched = fetch_mt5_data_multi(symbol, codes, 300, keep_connection=True)  # Get 300 bars
+                for timeframe, tf_code in pending:
+                    df = fetched.get(tf_code)
+                    if df is not None and not df.empty:
+                        bars[timeframe] = df
+                pending = [(timeframe, tf_code) for timeframe, tf_code in pending if timeframe not in bars]
+                codes = tuple(tf_code for _, tf_code in pending)
+                if not pending:
+                    break
+                logger.warning(f"No data received for {symbol} on {', '.join(tf for tf, _ in pending)} "
+                               f"(attempt {attempt + 1}/{self.max_retries})")
+            except Exception as e:
+                logger.error(f"Error fetching data for {symbol}: {str(e)}")
+            
+            if attempt < self.max_retries - 1:
+                time.sleep(self.retry_delay)
+        return bars
+    
+    def _generate_signals(self, symbol: str, strategies: Dict[str, Any]) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Signals for each timeframe's strategy instance. When there is more than
+        one and the strategy class offers generate_signals_for, all timeframes
+        are computed in one batched pass; otherwise, or if that fails, each
+        instance runs generate_signals on its own.
+        
+        Args:
+            symbol: Symbol being processed
+            strategies: Strategy instances by timeframe, data already set
+            
+        Returns:
+            Dict[str, Optional[pd.DataFrame]]: Signals by timeframe; timeframes
+            whose strategy failed are left out
+        """
+        if len(strategies) > 1:
+            generate_for = getattr(type(next(iter(strategies.values()))), 'generate_signals_for', None)
+            if generate_for is not None:
+                try:
+                    return generate_for(strategies)
+                except Exception as e:
+                    _error_log.error(f"batch:{symbol}",
+                                     f"Batched signal generation failed for {symbol}, falling back per timeframe: {str(e)}",
+                                     exc_info=VERBOSE)
+        
+        results: Dict[str, Optional[pd.DataFrame]] = {}
+        for timeframe, strategy in strategies.items():
+            try:
+                results[timeframe] = strategy.generate_signals()
+            except Exception as e:
+                _error_log.error(f"strategy:{symbol}:{timeframe}",
+                                 f"Error in strategy execution for {symbol} on {timeframe}: {str(e)}", exc_info=VERBOSE)
+        return results
+    
     def process_symbol(self, symbol: str) -> None:
         """
         Process trading signals for a single symbol across multiple timeframes.
@@ -249,71 +487,85 @@ class StrategyExecutor:
             return
             
         try:
-            # Ensure symbol is selected in Market Watch first (only if not already cached)
-            if symbol not in self.selected_symbols:
-                if not self._ensure_symbol_selected(symbol):
-                    logger.error(f"Failed to select symbol {symbol} for trading")
-                    return
+            # Ensure symbol is selected in Market Watch first (cached per SYMBOL_CACHE_TTL);
+            # raises SymbolSelectionError for run() to handle
+            self._ensure_symbol_selected(symbol)
                 
             # Get symbol info with validation (but don't fail if not found)
-            symbol_info = mt5.symbol_info(symbol)  # type: ignore[attr-defined]
+            symbol_info = _symbol_info_cached(symbol, _symbol_epoch())
             if symbol_info is None:
                 logger.warning(f"Symbol {symbol} not found in Market Watch, but continuing with cached selection")
                 # Don't remove from cache, just continue
                 # self.selected_symbols.discard(symbol)
                 # return
             
-            # Process each timeframe
-            for timeframe in self.timeframes:
+            # Fetch all timeframes in one batch
+            bars = self._fetch_bars(symbol)
+            
+            # Hand the new bars to each timeframe's strategy instance
+            strategy_name, strategy_cls = self._strategy_cls(symbol)
+            updated: Dict[str, Any] = {}
+            for timeframe, _ in self._tf_pairs:
                 logger.info(f"Processing {symbol} on {timeframe} timeframe")
-                
-                # Fetch historical data with retry
-                df = None
-                for attempt in range(self.max_retries):
-                    try:
-                        df = fetch_mt5_data(symbol, timeframe, 300)  # Get 300 bars
-                        if df is not None and not df.empty:
-                            break
-                        logger.warning(f"No data received for {symbol} on {timeframe} (attempt {attempt + 1}/{self.max_retries})")
-                    except Exception as e:
-                        logger.error(f"Error fetching data for {symbol} on {timeframe}: {str(e)}")
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay)
+                df = bars.get(timeframe)
                 
                 if df is None or df.empty:
                     logger.error(f"Failed to fetch data for {symbol} on {timeframe} after {self.max_retries} attempts")
                     continue
-            
-                # Update strategy with latest data
+                
+                # Nothing to do if the bars haven't changed since the last pass
+                bar_key = (symbol, timeframe)
+                if (self.last_bar_time.get(bar_key) == df.index[-1]
+                        and self._last_bar_close.get(bar_key) == df['close'].iat[-1]):
+                    logger.debug(f"No new data for {symbol} on {timeframe}, skipping")
+                    continue
+                
                 try:
-                    # Determine which strategy to use for this symbol
-                    registry = get_strategy_registry()
-                    strategy_name = STRATEGY_SELECTION.get(symbol, "MovingAverageStrategy")
-                    strategy_cls = registry.get(strategy_name)
-                    if not strategy_cls:
-                        logger.warning(f"Strategy '{strategy_name}' not found, using MovingAverageStrategy.")
-                        from strategy.moving_average import MovingAverageStrategy
-                        strategy_cls = MovingAverageStrategy
-                    strategy_key = f"{strategy_name}_{timeframe}"
-                    params = DEFAULT_STRATEGY_PARAMS.copy()
-                    params["data"] = df
-                    params["lot_size"] = DEFAULT_LOT_SIZE
-                    self.strategies[strategy_key] = strategy_cls(**params)
+                    # Reuse this symbol/timeframe's strategy instance, swapping in the new bars
+                    strategy_key = (symbol, timeframe, strategy_name)
+                    strategy = self.strategies.get(strategy_key)
+                    if strategy is None:
+                        strategy = self.strategies[strategy_key] = strategy_cls(data=df, **self._base_params)
+                    else:
+                        strategy.data = df
+                        # Trade limits are per pass, as when each pass built its own instance
+                        reset_trade_limits = getattr(strategy, 'reset_trade_limits', None)
+                        if reset_trade_limits:
+                            reset_trade_limits()
                     logger.debug(f"Updated strategy data for {symbol} on {timeframe} with {len(df)} bars")
-                    # Generate signals
-                    signals = self.strategies[strategy_key].generate_signals()
-                    if signals is None or signals.empty:
-                        logger.warning(f"No signals generated for {symbol} on {timeframe}")
-                        continue
-                    logger.debug(f"Generated signals for {symbol} on {timeframe}: {signals[['close', 'Signal']].tail().to_string()}")
                 except Exception as e:
-                    logger.error(f"Error in strategy execution for {symbol} on {timeframe}: {str(e)}", exc_info=VERBOSE)
+                    _error_log.error(f"strategy:{symbol}:{timeframe}",
+                                     f"Error in strategy execution for {symbol} on {timeframe}: {str(e)}", exc_info=VERBOSE)
+                    continue
+                updated[timeframe] = strategy
+            
+            # Generate signals for every updated timeframe, batched when the strategy supports it
+            all_signals = self._generate_signals(symbol, updated)
+            
+            for timeframe, strategy in updated.items():
+                signals = all_signals.get(timeframe)
+                if signals is None or signals.empty:
+                    logger.warning(f"No signals generated for {symbol} on {timeframe}")
+                    continue
+                try:
+                    if logger.isEnabledFor(logging.DEBUG):  # Skip formatting the tail unless it is logged
+                        logger.debug(f"Generated signals for {symbol} on {timeframe}: {signals[['close', 'Signal']].tail().to_string()}")
+                    # Latest signal, through the strategy's overtrading/cooldown check if it has one
+                    get_latest_signal = getattr(strategy, 'get_latest_signal', None)
+                    latest_signal = get_latest_signal() if get_latest_signal else signals['Signal'].iat[-1]
+                except Exception as e:
+                    _error_log.error(f"strategy:{symbol}:{timeframe}",
+                                     f"Error in strategy execution for {symbol} on {timeframe}: {str(e)}", exc_info=VERBOSE)
                     continue
                 
-                # Get latest signal and price
-                latest_signal = signals['Signal'].iloc[-1]
-                latest_price = signals['close'].iloc[-1]
+                # The decision for these bars is made; don't repeat it until they change
+                df = strategy.data
+                bar_key = (symbol, timeframe)
+                self.last_bar_time[bar_key] = df.index[-1]
+                self._last_bar_close[bar_key] = df['close'].iat[-1]
+                
+                # Get latest price
+                latest_price = signals['close'].iat[-1]
                 
                 # Skip if no signal
                 if latest_signal == 0:
@@ -374,9 +626,21 @@ class StrategyExecutor:
                 if not trade_success:
                     logger.error(f"Failed to execute {signal_type} order for {symbol} on {timeframe} after {self.max_retries} attempts")
             
+        except SymbolSelectionError:
+            raise
         except Exception as e:
             logger.error(f"Error processing {symbol}: {str(e)}")
     
+    def _set_selected(self, symbol: str, selected: bool) -> None:
+        """Add or remove symbol in the selected-symbol cache and refresh its frozen snapshot."""
+        if (symbol in self.selected_symbols) == selected:
+            return
+        if selected:
+            self.selected_symbols.add(symbol)
+        else:
+            self.selected_symbols.discard(symbol)
+        self._selected_frozen = frozenset(self.selected_symbols)
+    
     def _ensure_symbol_selected(self, symbol: str) -> bool:
         """
         Ensure the symbol is selected in Market Watch with retry logic.
@@ -385,17 +649,20 @@ class StrategyExecutor:
             symbol: Symbol to select
             
         Returns:
-            bool: True if symbol is selected, False otherwise
+            bool: True once the symbol is selected
+            
+        Raises:
+            SymbolSelectionError: If the symbol could not be selected after all retries
         """
         # Check if symbol is already in cache and verify it's still available
-        if symbol in self.selected_symbols:
+        if symbol in self._selected_frozen:
             try:
-                symbol_info = mt5.symbol_info(symbol)  # type: ignore[attr-defined]
+                symbol_info = _symbol_info_cached(symbol, _symbol_epoch())
                 if symbol_info is not None and symbol_info.visible:
                     return True
                 else:
                     # Symbol is no longer available, remove from cache
-                    self.selected_symbols.discard(symbol)
+                    self._set_selected(symbol, False)
             except Exception:
                 # If we can't check, assume it's still selected
                 return True
@@ -407,13 +674,13 @@ class StrategyExecutor:
                 symbol_info = mt5.symbol_info(symbol)  # type: ignore[attr-defined]
                 if symbol_info is not None and symbol_info.visible:
                     logger.debug(f"Symbol {symbol} is already selected in Market Watch")
-                    self.selected_symbols.add(symbol)  # Add to cache
+                    self._set_selected(symbol, True)  # Add to cache
                     return True
                 
                 # Try to select it
                 if mt5.symbol_select(symbol, True):  # type: ignore[attr-defined]
                     logger.info(f"Successfully selected {symbol} in Market Watch")
-                    self.selected_symbols.add(symbol)  # Add to cache
+                    self._set_selected(symbol, True)  # Add to cache
                     return True
                 else:
                     logger.warning(f"Failed to select {symbol} (attempt {attempt + 1}/{self.max_retries})")
@@ -425,8 +692,7 @@ class StrategyExecutor:
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)
                     
-        logger.error(f"Failed to select {symbol} after {self.max_retries} attempts")
-        return False
+        raise SymbolSelectionError(f"Failed to select {symbol} after {self.max_retries} attempts")
     
     def run(self) -> bool:
         """
@@ -471,13 +737,11 @@ class StrategyExecutor:
                 try:
                     current_time = time.time()
                     
-                    # Only check symbol selection periodically to avoid continuous errors
+                    # Symbol lookups are re-checked when their cache bucket expires
+                    # (SYMBOL_CACHE_TTL), so only the failure counter is reset here
                     if current_time - last_successful_symbol_check > symbol_check_interval:
-                        # Clear cache to force symbol re-check
-                        self.selected_symbols.clear()
                         last_successful_symbol_check = current_time
                         symbol_failures = 0  # Reset failure counter
-                        logger.debug("Cleared symbol cache for periodic re-check")
                     
                     # Process the symbol
                     self.process_symbol(SYMBOLS[0])
@@ -487,32 +751,36 @@ class StrategyExecutor:
                     symbol_failures = 0  # Reset symbol failure counter on success
                     last_successful_symbol_check = current_time
                     
-                    # Sleep before next iteration
-                    time.sleep(1)  # Check every second
+                    # Sleep until the next bar closes instead of polling every second
+                    time.sleep(_seconds_until_next_bar(self.timeframes, time.time()))
                     
                 except KeyboardInterrupt:
                     logger.info("Trading bot stopped by user")
                     break
                     
+                except SymbolSelectionError as e:
+                    # Recovered by clearing the symbol caches, not counted towards stopping the bot
+                    logger.error(str(e))
+                    symbol_failures += 1
+                    if symbol_failures >= max_symbol_failures:
+                        logger.warning(f"Too many symbol selection failures ({symbol_failures}), clearing cache and waiting")
+                        self.selected_symbols = set()
+                        self._selected_frozen = frozenset()
+                        _symbol_info_cached.cache_clear()
+                        symbol_failures = 0
+                        time.sleep(30)  # Wait 30 seconds before retrying
+                    
                 except Exception as e:
                     consecutive_errors += 1
                     
-                    # Check if it's a symbol selection error
-                    if "Failed to select" in str(e) or "Symbol" in str(e):
-                        symbol_failures += 1
-                        if symbol_failures >= max_symbol_failures:
-                            logger.warning(f"Too many symbol selection failures ({symbol_failures}), clearing cache and waiting")
-                            self.selected_symbols.clear()
-                            symbol_failures = 0
-                            time.sleep(30)  # Wait 30 seconds before retrying
-                    else:
-                        # For non-symbol errors, use exponential backoff
-                        wait_time = min(60, self.retry_delay * (2 ** (consecutive_errors - 1)))
-                        logger.info(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                    # Exponential backoff
+                    wait_time = min(60, self.retry_delay * (2 ** (consecutive_errors - 1)))
+                    logger.info(f"Retrying in {wait_time} seconds...")
+                    time.sleep(wait_time)
                     
-                    logger.error(f"Error in main loop (attempt {consecutive_errors}/{max_consecutive_errors}): {str(e)}", 
-                               exc_info=VERBOSE)  # Full traceback only in verbose mode
+                    _error_log.error("main_loop",
+                                     f"Error in main loop (attempt {consecutive_errors}/{max_consecutive_errors}): {str(e)}",
+                                     exc_info=VERBOSE)  # Tracebacks only in verbose mode, and rate limited
                     
                     if consecutive_errors >= max_consecutive_errors:
                         logger.error(f"Too many consecutive errors ({max_consecutive_errors}), stopping bot")
@@ -535,17 +803,6 @@ class StrategyExecutor:
         
         return True  # Return True if bot completed successfully
 
-# MT5 timeframe mapping
-TIMEFRAME_MAPPING = {
-    'M1': mt5.TIMEFRAME_M1,
-    'M5': mt5.TIMEFRAME_M5,
-    'M15': mt5.TIMEFRAME_M15,
-    'M30': mt5.TIMEFRAME_M30,
-    'H1': mt5.TIMEFRAME_H1,
-    'H4': mt5.TIMEFRAME_H4,
-    'D1': mt5.TIMEFRAME_D1,
-}
-
 if __name__ == "__main__":
     executor = StrategyExecutor()
     executor.run()
@@ -6,7 +6,7 @@ Tests 30% stop-loss, error handling, and strategy improvements
 
 import time
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import os
 os.environ['LOG_FORMAT'] = 'json'  # Enable structured JSON logging for this script
@@ -15,6 +15,7 @@ os.environ['LOG_FORMAT'] = 'json'  # Enable structured JSON logging for this scr
 from config import SYMBOLS, TIMEFRAMES, STOP_LOSS_PERCENT, TAKE_PROFIT_PERCENT, DEFAULT_LOT_SIZE, PAPER_TRADING
 from strategy.moving_average import MovingAverageStrategy
 from risk.risk_manager import RiskManager
+from utils.cache import ArrayCache
 from utils.logger import get_logger
 from data.fetch_mt5 import fetch_mt5_data, login_mt5
 from execution.mt5_executor import send_order
@@ -73,7 +74,8 @@ def test_strategy() -> bool:
     
     try:
         # Fetch test data
-        data = fetch_mt5_data(SYMBOLS[0], TIMEFRAMES[0], n_bars=100)
+        data = fetch_mt5_data(SYMBOLS[0], TIMEFRAMES[0], n_bars=100, cache=ArrayCache(),
+                              keep_connection=True)
         if data is None or data.empty:
             logger.warning("⚠️ No test data available, skipping strategy test")
             return True
@@ -111,8 +113,7 @@ def test_strategy() -> bool:
         return True
         
     except Exception as e:
-        logger.error(f"❌ Strategy test failed: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Strategy test failed: %s", e)
         return False
 
 def test_mt5_connection() -> bool:
@@ -178,7 +179,7 @@ def test_error_handling() -> bool:
         
         # Test missing data handling
         try:
-            data = fetch_mt5_data("INVALID_SYMBOL", "M1", n_bars=10)
+            data = fetch_mt5_data("INVALID_SYMBOL", "M1", n_bars=10, keep_connection=True)
             if data is None:
                 logger.info("✅ Missing data handled correctly")
         except Exception as e:
@@ -209,14 +210,33 @@ def run_all_tests() -> bool:
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        logger.info(f"\n📋 Running {test_name} Test...")
-        if test_func():
+    def record(test_name, ok):
+        nonlocal passed
+        if ok:
             passed += 1
             logger.info(f"{test_name} Test PASSED")
         else:
             logger.error(f"❌ {test_name} Test FAILED")
     
+    if PAPER_TRADING:
+        # MT5 connection runs first so the other tests find a live session
+        # (the fetches keep it open); the rest are independent and run concurrently
+        logger.info("\n📋 Running MT5 Connection Test...")
+        record("MT5 Connection", test_mt5_connection())
+        others = [(name, func) for name, func in tests if func is not test_mt5_connection]
+        with ThreadPoolExecutor(max_workers=len(others)) as executor:
+            futures = {}
+            for test_name, test_func in others:
+                logger.info(f"\n📋 Running {test_name} Test...")
+                futures[executor.submit(test_func)] = test_name
+            for future in as_completed(futures):
+                record(futures[future], future.result())
+    else:
+        # Live account: keep the tests strictly one after another
+        for test_name, test_func in tests:
+            logger.info(f"\n📋 Running {test_name} Test...")
+            record(test_name, test_func())
+    
     logger.info("=" * 50)
     logger.info(f"📊 Test Results: {passed}/{total} tests passed")
     
@@ -242,8 +262,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("🛑 Testing interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Fatal error during testing: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("❌ Fatal error during testing: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Indicator implementations (compiled kernels when Numba is installed,
+Polars expressions) against the pandas definitions
+
+Under pandas 3 Copy-on-Write, Series.to_numpy() returns read-only views, so
+these also run every compiled path on read-only inputs.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.indicators import (
+    calculate_atr,
+    calculate_ema,
+    calculate_macd,
+    calculate_rsi,
+    calculate_sma,
+)
+from utils.indicators_nb import atr_kernel, latest_atr, rsi_kernel
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    close = pd.Series(100 + rng.standard_normal(300).cumsum())
+    spread = rng.uniform(0.1, 1.0, len(close))
+    return pd.DataFrame({'high': close + spread, 'low': close - spread, 'close': close})
+
+
+def _readonly(values):
+    values = np.array(values, dtype=np.float64)
+    values.setflags(write=False)
+    return values
+
+
+def test_rsi_matches_pandas(prices):
+    close = prices['close']
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    expected = 100 - (100 / (1 + gain / loss))
+    np.testing.assert_allclose(calculate_rsi(close, 14), expected, rtol=1e-9)
+
+
+def test_atr_matches_pandas(prices):
+    prev_close = prices['close'].shift()
+    true_range = pd.concat([
+        prices['high'] - prices['low'],
+        (prices['high'] - prev_close).abs(),
+        (prices['low'] - prev_close).abs(),
+    ], axis=1).max(axis=1)
+    expected = true_range.rolling(window=14).mean()
+    np.testing.assert_allclose(calculate_atr(prices, 14), expected, rtol=1e-9)
+
+
+def test_sma_ema_macd_match_pandas(prices):
+    close = prices['close']
+    np.testing.assert_allclose(calculate_sma(close, 20), close.rolling(window=20).mean(), rtol=1e-9)
+    np.testing.assert_allclose(calculate_ema(close, 20), close.ewm(span=20, adjust=False).mean(), rtol=1e-9)
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal = macd.ewm(span=9, adjust=False).mean()
+    for got, expected in zip(calculate_macd(close), (macd, signal, macd - signal)):
+        np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_kernels_accept_readonly_inputs(prices):
+    high, low, close = (_readonly(prices[col]) for col in ('high', 'low', 'close'))
+    out = np.empty(len(close))
+    rsi_kernel(close, 14, out)
+    np.testing.assert_allclose(out, calculate_rsi(prices['close'], 14), rtol=1e-9)
+    atr_kernel(high, low, close, 14, out)
+    np.testing.assert_allclose(out, calculate_atr(prices, 14), rtol=1e-9)
+    assert latest_atr(high, low, close, 14) == pytest.approx(out[-1])
+
+
+def test_polars_expressions_match(prices):
+    pl = pytest.importorskip("polars")
+    from utils.indicators_pl import add_indicators
+
+    frame = add_indicators(pl.from_pandas(prices), short_window=10, long_window=30)
+    close = prices['close']
+    macd, signal, _ = calculate_macd(close)
+    expected = {
+        'Short_MA': close.rolling(window=10, min_periods=1).mean(),
+        'Long_MA': close.rolling(window=30, min_periods=1).mean(),
+        'RSI': calculate_rsi(close, 14),
+        'ATR': calculate_atr(prices, 14),
+        'MACD': macd,
+        'MACD_Signal': signal,
+    }
+    for column, values in expected.items():
+        np.testing.assert_allclose(frame[column].to_numpy(), values, rtol=1e-9, atol=1e-12, err_msg=column)
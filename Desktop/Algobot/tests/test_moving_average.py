@@ -0,0 +1,46 @@
+"""MovingAverageStrategy on reused instances against a fresh compute"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategy.moving_average import MovingAverageStrategy
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(1)
+    close = 100 + rng.standard_normal(500).cumsum()
+    spread = rng.uniform(0.1, 1.0, len(close))
+    index = pd.date_range('2024-01-01', periods=len(close), freq='min')
+    return pd.DataFrame({'open': close, 'high': close + spread, 'low': close - spread, 'close': close},
+                        index=index)
+
+
+def _live_frames(bars, window=300):
+    """Frames as the live loop sees them: the forming bar moves, new bars slide the window."""
+    for end in range(window, window + 40):
+        for tweak in (0.0, 0.25, -0.25):
+            frame = bars.iloc[end - window:end].copy()
+            frame.iloc[-1, frame.columns.get_loc('close')] += tweak
+            yield frame
+    # Growing series that keeps its first bar
+    for end in range(window + 40, window + 60):
+        yield bars.iloc[:end].copy()
+
+
+def test_reused_instance_matches_fresh_compute(bars):
+    params = dict(use_macd=True, use_atr_band=True, volatility_filter=True)
+    strategy = MovingAverageStrategy(bars.iloc[:300], **params)
+    for frame in _live_frames(bars):
+        strategy.data = frame
+        got = strategy.generate_signals().copy()
+        expected = MovingAverageStrategy(frame, **params).generate_signals()
+        pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-5)
+
+
+def test_empty_frame_gives_empty_signals(bars):
+    strategy = MovingAverageStrategy(bars.iloc[:0])
+    signals = strategy.generate_signals()
+    assert signals.empty
+    assert {'Signal', 'Position', 'Short_MA', 'Long_MA', 'RSI', 'ATR'} <= set(signals.columns)
+    assert strategy.get_latest_signal() == 0
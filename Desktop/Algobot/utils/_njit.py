@@ -0,0 +1,19 @@
+"""Optional Numba import shared by the compiled kernel modules
+
+When Numba is missing NUMBA_AVAILABLE is False, njit is a no-op decorator
+(so decorated functions stay plain Python), prange is range and the type
+objects used for explicit signatures (and numba.types) are None.
+"""
+try:
+    from numba import njit, prange, float32, float64, int64, void, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    float32 = float64 = int64 = void = types = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -1,8 +1,79 @@
 import os
+import atexit
 import smtplib
-from email.mime.text import MIMEText
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import EmailMessage
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.logger import get_logger
+
+logger = get_logger("Alerts")
+
+# One logged-in SMTP connection per thread, reused across emails so the TLS
+# handshake and login happen once per session rather than once per alert
+_smtp_local = threading.local()
+_smtp_conns = []  # every cached connection, closed at exit
+_smtp_conns_lock = threading.Lock()
+
+def _quit_smtp(conn: smtplib.SMTP) -> None:
+    try:
+        conn.quit()
+    except Exception:
+        conn.close()
+
+def _get_smtp(host: str, port: int, user: str, password: str) -> smtplib.SMTP:
+    """This thread's SMTP connection for (host, port, user), connecting and logging in if needed."""
+    key = (host, port, user)
+    conn = getattr(_smtp_local, 'conn', None)
+    if conn is not None and _smtp_local.key == key:
+        return conn
+    _drop_smtp()
+    conn = smtplib.SMTP(host, port)
+    try:
+        conn.starttls()
+        conn.login(user, password)
+    except Exception:
+        conn.close()
+        raise
+    _smtp_local.conn, _smtp_local.key = conn, key
+    with _smtp_conns_lock:
+        _smtp_conns.append(conn)
+    return conn
+
+def _drop_smtp() -> None:
+    """Close and forget this thread's SMTP connection."""
+    conn = getattr(_smtp_local, 'conn', None)
+    _smtp_local.conn = None
+    if conn is None:
+        return
+    with _smtp_conns_lock:
+        if conn in _smtp_conns:
+            _smtp_conns.remove(conn)
+    _quit_smtp(conn)
+
+def _close_all_smtp() -> None:
+    with _smtp_conns_lock:
+        conns = _smtp_conns[:]
+        _smtp_conns.clear()
+    for conn in conns:
+        _quit_smtp(conn)
+
+# Registered before the pool's shutdown, so it runs after pending alerts are sent
+atexit.register(_close_all_smtp)
+
+# Background workers for the *_async senders; pending alerts are flushed at exit
+_ALERT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='alerts')
+atexit.register(_ALERT_POOL.shutdown, wait=True)
+
+# Pooled keep-alive session for Telegram, so consecutive alerts reuse the TLS
+# connection. Retry only covers connection failures: urllib3 does not resend
+# a POST after it reached the server.
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                          max_retries=Retry(total=2, backoff_factor=0.3)))
 
 def send_email_alert(subject: str, message: str, to_email: Optional[str] = None) -> bool:
     """
@@ -22,18 +93,24 @@ def send_email_alert(subject: str, message: str, to_email: Optional[str] = None)
     to_email = to_email or os.environ.get('ALERT_EMAIL_TO')
     if not (smtp_user and smtp_pass and to_email):
         return False
-    try:
-        msg = MIMEText(message)
-        msg['Subject'] = subject
-        msg['From'] = from_email
-        msg['To'] = to_email
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_user, smtp_pass)
-            server.sendmail(from_email, [to_email], msg.as_string())
-        return True
-    except Exception:
-        return False
+    msg = EmailMessage()
+    msg['Subject'] = subject
+    msg['From'] = from_email
+    msg['To'] = to_email
+    msg.set_content(message)
+    # A cached connection may have been closed by the server while idle:
+    # reconnect and retry once
+    for _ in range(2):
+        try:
+            _get_smtp(smtp_server, smtp_port, smtp_user, smtp_pass).send_message(
+                msg, from_addr=from_email, to_addrs=[to_email])
+            return True
+        except smtplib.SMTPServerDisconnected:
+            _drop_smtp()
+        except Exception:
+            _drop_smtp()
+            return False
+    return False
 
 def send_telegram_alert(message: str, chat_id: Optional[str] = None) -> bool:
     """
@@ -51,7 +128,38 @@ def send_telegram_alert(message: str, chat_id: Optional[str] = None) -> bool:
     url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
     payload = {'chat_id': chat_id, 'text': message}
     try:
-        resp = requests.post(url, data=payload, timeout=10)
+        resp = _TG_SESSION.post(url, data=payload, timeout=10)
         return resp.status_code == 200
     except Exception:
-        return False 
\ No newline at end of file
+        return False
+
+def _log_failure(kind: str):
+    """Done-callback for an async alert that logs when delivery failed."""
+    def callback(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.error(f"{kind} alert failed: {error}")
+        elif not future.result():
+            # Also the result when alerts of this kind aren't configured, so keep it quiet
+            logger.debug(f"{kind} alert was not sent")
+    return callback
+
+def send_email_alert_async(subject: str, message: str, to_email: Optional[str] = None) -> Future:
+    """
+    send_email_alert on the alert pool, so the caller doesn't wait on SMTP.
+    Returns:
+        Future: Resolves to send_email_alert's result; failures are logged.
+    """
+    future = _ALERT_POOL.submit(send_email_alert, subject, message, to_email)
+    future.add_done_callback(_log_failure("Email"))
+    return future
+
+def send_telegram_alert_async(message: str, chat_id: Optional[str] = None) -> Future:
+    """
+    send_telegram_alert on the alert pool, so the caller doesn't wait on HTTP.
+    Returns:
+        Future: Resolves to send_telegram_alert's result; failures are logged.
+    """
+    future = _ALERT_POOL.submit(send_telegram_alert, message, chat_id)
+    future.add_done_callback(_log_failure("Telegram"))
+    return future
@@ -3,14 +3,63 @@ Analytics Module
 Enhanced logging and performance tracking
 """
 
+import csv
 import json
-import pandas as pd
+import logging
+from collections import defaultdict, deque
 from datetime import datetime
+import numpy as np
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from utils.logger import get_logger
 from config import SYMBOLS
 
 logger = get_logger("Analytics")
 
+# Columns of the CSV export, in the order trade records gain their keys
+_FIELDS = (
+    'timestamp', 'symbol', 'direction', 'entry_price', 'lot_size', 'stop_loss', 'take_profit',
+    'indicators', 'reason', 'status', 'exit_price', 'pnl', 'exit_reason', 'duration', 'exit_timestamp',
+)
+
+# Trade status codes in TradeAnalytics._status
+_OPEN = 0
+_CLOSED = 1
+
+def _json_default(obj):
+    """json.dump fallback: ISO 8601 for datetimes, str() for anything else."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+class _RollingMax:
+    """
+    Maximum of the last roll_ind pushed values, O(1) amortized per push.
+    
+    Keeps a monotone decreasing deque of (position, value): a new value
+    evicts every smaller one before it, since they can no longer be the
+    maximum, and the head leaves once it falls out of the window.
+    """
+    def __init__(self, roll_ind=100):
+        self.roll_ind = roll_ind
+        self._window = deque()
+        self._pushed = 0
+        
+    def push(self, x):
+        window = self._window
+        while window and window[-1][1] <= x:
+            window.pop()
+        window.append((self._pushed, x))
+        self._pushed += 1
+        if window[0][0] <= self._pushed - 1 - self.roll_ind:
+            window.popleft()
+            
+    def max(self):
+        """Window maximum, None before the first push."""
+        return self._window[0][1] if self._window else None
+
 class TradeAnalytics:
     def __init__(self):
         self.trades = []
@@ -27,6 +76,36 @@ class TradeAnalytics:
             'sharpe_ratio': 0.0
         }
         self.session_start_time = datetime.now()
+        # Indexes into self.trades of open trades per symbol, oldest first
+        self._open_by_symbol = defaultdict(deque)
+        # Columnar copy of the fields the metrics aggregate, row i = self.trades[i],
+        # so they reduce with NumPy instead of looping over the trade dicts
+        self._n = 0
+        self._pnl = np.empty(1024, dtype=np.float64)
+        self._symbol_idx = np.empty(1024, dtype=np.int32)
+        self._status = np.empty(1024, dtype=np.int8)
+        self._symbols = []  # symbol_idx -> symbol
+        self._symbol_ids = {}  # symbol -> symbol_idx
+        # Peak running PnL over the last 100 closed trades, for should_halt
+        self._roll_max = _RollingMax(roll_ind=100)
+        
+    def _append_row(self, symbol):
+        """Add a column row for a new open trade, doubling the buffers when full."""
+        n = self._n
+        if n == len(self._pnl):
+            for name in ('_pnl', '_symbol_idx', '_status'):
+                old = getattr(self, name)
+                new = np.empty(2 * n, dtype=old.dtype)
+                new[:n] = old
+                setattr(self, name, new)
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        self._pnl[n] = np.nan
+        self._symbol_idx[n] = symbol_id
+        self._status[n] = _OPEN
+        self._n = n + 1
         
     def log_trade_entry(self, symbol, direction, entry_price, lot_size, stop_loss, take_profit, 
                        indicators=None, reason=""):
@@ -44,7 +123,13 @@ class TradeAnalytics:
             'status': 'open'
         }
         
+        self._open_by_symbol[symbol].append(len(self.trades))
         self.trades.append(trade)
+        self._append_row(symbol)
+        
+        # Skip building the report lines when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
         # Log detailed entry information
         logger.info("=" * 80)
@@ -66,61 +151,77 @@ class TradeAnalytics:
         
     def log_trade_exit(self, symbol, exit_price, pnl, reason="", duration=None):
         """Log detailed trade exit information."""
-        # Find the corresponding trade
-        for trade in self.trades:
-            if trade['symbol'] == symbol and trade['status'] == 'open':
-                trade['exit_price'] = exit_price
-                trade['pnl'] = pnl
-                trade['exit_reason'] = reason
-                trade['duration'] = duration
-                trade['status'] = 'closed'
-                trade['exit_timestamp'] = datetime.now()
-                
-                # Update performance metrics
-                self._update_performance_metrics(trade)
-                
-                # Log detailed exit information
-                logger.info("=" * 80)
-                logger.info(f"[EXIT] TRADE EXIT: {symbol}")
-                logger.info("=" * 80)
-                logger.info(f"Exit Price: {exit_price:.5f}")
-                logger.info(f"PnL: ${pnl:.2f}")
-                logger.info(f"Exit Reason: {reason}")
-                if duration:
-                    logger.info(f"Duration: {duration}")
-                logger.info(f"Win/Loss: {'WIN' if pnl > 0 else 'LOSS'}")
-                logger.info("=" * 80)
-                
-                break
+        # Find the corresponding trade (the oldest open one for the symbol)
+        open_trades = self._open_by_symbol.get(symbol)
+        if not open_trades:
+            return
+        index = open_trades.popleft()
+        trade = self.trades[index]
+        trade['exit_price'] = exit_price
+        trade['pnl'] = pnl
+        trade['exit_reason'] = reason
+        trade['duration'] = duration
+        trade['status'] = 'closed'
+        trade['exit_timestamp'] = datetime.now()
+        
+        self._pnl[index] = pnl
+        self._status[index] = _CLOSED
+        
+        # Update performance metrics
+        self._update_performance_metrics()
+        self._roll_max.push(self.performance_metrics['total_pnl'])
+        
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Log detailed exit information
+        logger.info("=" * 80)
+        logger.info(f"[EXIT] TRADE EXIT: {symbol}")
+        logger.info("=" * 80)
+        logger.info(f"Exit Price: {exit_price:.5f}")
+        logger.info(f"PnL: ${pnl:.2f}")
+        logger.info(f"Exit Reason: {reason}")
+        if duration:
+            logger.info(f"Duration: {duration}")
+        logger.info(f"Win/Loss: {'WIN' if pnl > 0 else 'LOSS'}")
+        logger.info("=" * 80)
                 
-    def _update_performance_metrics(self, trade):
-        """Update performance metrics after trade closure."""
-        self.performance_metrics['total_trades'] += 1
-        self.performance_metrics['total_pnl'] += trade['pnl']
+    def _update_performance_metrics(self):
+        """Recompute performance metrics from the closed-trade columns."""
+        n = self._n
+        pnl = self._pnl[:n][self._status[:n] == _CLOSED]
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        
+        total = pnl.size
+        self.performance_metrics['total_trades'] = total
+        self.performance_metrics['total_pnl'] = float(pnl.sum())
+        self.performance_metrics['winning_trades'] = wins.size
+        self.performance_metrics['losing_trades'] = total - wins.size
         
-        if trade['pnl'] > 0:
-            self.performance_metrics['winning_trades'] += 1
-        else:
-            self.performance_metrics['losing_trades'] += 1
-            
         # Calculate win rate
-        total = self.performance_metrics['total_trades']
-        wins = self.performance_metrics['winning_trades']
-        self.performance_metrics['win_rate'] = wins / total if total > 0 else 0
+        self.performance_metrics['win_rate'] = wins.size / total if total > 0 else 0
         
         # Calculate average win/loss
-        winning_trades = [t for t in self.trades if t.get('pnl', 0) > 0]
-        losing_trades = [t for t in self.trades if t.get('pnl', 0) < 0]
-        
-        if winning_trades:
-            self.performance_metrics['avg_win'] = sum(t['pnl'] for t in winning_trades) / len(winning_trades)
-        if losing_trades:
-            self.performance_metrics['avg_loss'] = sum(t['pnl'] for t in losing_trades) / len(losing_trades)
+        if wins.size:
+            self.performance_metrics['avg_win'] = float(wins.mean())
+        if losses.size:
+            self.performance_metrics['avg_loss'] = float(losses.mean())
             
         # Calculate profit factor
-        total_wins = sum(t['pnl'] for t in winning_trades)
-        total_losses = abs(sum(t['pnl'] for t in losing_trades))
-        self.performance_metrics['profit_factor'] = total_wins / total_losses if total_losses > 0 else float('inf')
+        total_losses = abs(float(losses.sum()))
+        self.performance_metrics['profit_factor'] = float(wins.sum()) / total_losses if total_losses > 0 else float('inf')
+        
+    def should_halt(self, lower_limit):
+        """
+        Cut-losses check: True when the running PnL has dropped more than
+        -lower_limit (lower_limit is negative, e.g. -500) below its peak
+        over the last 100 closed trades.
+        """
+        peak = self._roll_max.max()
+        if peak is None:
+            return False
+        return self.performance_metrics['total_pnl'] - lower_limit < peak
         
     def get_performance_summary(self):
         """Get comprehensive performance summary."""
@@ -143,6 +244,8 @@ class TradeAnalytics:
         
     def log_performance_summary(self):
         """Log current performance summary."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         summary = self.get_performance_summary()
         
         logger.info("=" * 80)
@@ -165,24 +268,21 @@ class TradeAnalytics:
         if filename is None:
             filename = f"trade_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-        # Convert trades to serializable format
-        serializable_trades = []
-        for trade in self.trades:
-            serializable_trade = trade.copy()
-            serializable_trade['timestamp'] = trade['timestamp'].isoformat()
-            if 'exit_timestamp' in trade:
-                serializable_trade['exit_timestamp'] = trade['exit_timestamp'].isoformat()
-            serializable_trades.append(serializable_trade)
-            
+        # Trades go out as-is; datetimes are written as ISO 8601 by the encoder
         data = {
-            'trades': serializable_trades,
+            'trades': self.trades,
             'performance_metrics': self.performance_metrics,
-            'session_start_time': self.session_start_time.isoformat(),
-            'session_end_time': datetime.now().isoformat()
+            'session_start_time': self.session_start_time,
+            'session_end_time': datetime.now()
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, default=str,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2, default=_json_default)
             
         logger.info(f"Trade history saved to {filename}")
         
@@ -191,25 +291,37 @@ class TradeAnalytics:
         if filename is None:
             filename = f"trade_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             
-        df = pd.DataFrame(self.trades)
-        df.to_csv(filename, index=False)
+        # Stream rows straight from the trade dicts; indicators become a JSON column
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for trade in self.trades:
+                row = dict(trade)
+                row['indicators'] = json.dumps(trade['indicators'], default=str) if trade.get('indicators') else ''
+                writer.writerow(row)
         logger.info(f"Trade history exported to {filename}")
         
     def get_symbol_performance(self, symbol):
         """Get performance metrics for a specific symbol."""
-        symbol_trades = [t for t in self.trades if t['symbol'] == symbol]
+        symbol_id = self._symbol_ids.get(symbol)
         
-        if not symbol_trades:
+        if symbol_id is None:
             return None
             
-        total_pnl = sum(t.get('pnl', 0) for t in symbol_trades)
-        winning_trades = [t for t in symbol_trades if t.get('pnl', 0) > 0]
-        win_rate = len(winning_trades) / len(symbol_trades) if symbol_trades else 0
+        n = self._n
+        mine = self._symbol_idx[:n] == symbol_id
+        pnl = self._pnl[:n][mine & (self._status[:n] == _CLOSED)]
+        stats = {
+            'total_trades': int(mine.sum()),
+            'winning_trades': int((pnl > 0).sum()),
+            'total_pnl': float(pnl.sum()),
+        }
+        win_rate = stats['winning_trades'] / stats['total_trades']
         
         return {
             'symbol': symbol,
-            'total_trades': len(symbol_trades),
-            'winning_trades': len(winning_trades),
+            'total_trades': stats['total_trades'],
+            'winning_trades': stats['winning_trades'],
             'win_rate': f"{win_rate:.1%}",
-            'total_pnl': f"${total_pnl:.2f}"
+            'total_pnl': f"${stats['total_pnl']:.2f}"
         } 
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Ahead-of-time build of the utils.indicators kernels
+
+Compiles the Numba kernels used by utils.indicators into the native
+extension utils/_indicators_aot, which utils.indicators loads in preference
+to the JIT versions so the live bot and the tests skip the compile (or
+cache load) on startup. Requires Numba; rebuild after changing a kernel:
+
+    python -m utils.build_aot
+"""
+import os
+
+from numba.pycc import CC
+
+from utils import indicators_nb
+
+cc = CC('_indicators_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Same signatures as the JIT kernels (read-only inputs); py_func is the undecorated Python source
+cc.export('rsi_kernel', indicators_nb.RSI_SIGS[0])(indicators_nb.rsi_kernel.py_func)
+cc.export('atr_kernel', indicators_nb.ATR_SIGS[0])(indicators_nb.atr_kernel.py_func)
+cc.export('macd_kernel', indicators_nb.MACD_SIGS[0])(indicators_nb.macd_kernel.py_func)
+cc.export('sma_kernel', indicators_nb.SMA_SIGS[0])(indicators_nb.sma_kernel.py_func)
+cc.export('ema_kernel', indicators_nb.EMA_SIGS[0])(indicators_nb.ema_kernel.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,85 @@
+"""
+On-disk array cache
+
+Arrays are stored as .cache/<key>.npy with a <key>.json stamp holding the
+expiry time. Keys are built from whatever identifies the data (symbol,
+timeframe, bar count, last bar time, ...) with cache_key, so freshness is
+decided by the key itself and the TTL only keeps the directory from
+growing without bound.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger("Cache")
+
+CACHE_DIR = ".cache"
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+def cache_key(*parts) -> str:
+    """Hex digest identifying a cache entry, from the parts' str() values."""
+    raw = "|".join(str(part) for part in parts).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+class ArrayCache:
+    def __init__(self, directory: str = CACHE_DIR, ttl: float = DEFAULT_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key)
+        return base + ".npy", base + ".json"
+        
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached array for key, or None if missing, expired or unreadable."""
+        array_path, stamp_path = self._paths(key)
+        try:
+            with open(stamp_path) as f:
+                if json.load(f)['expires'] < time.time():
+                    return None
+            return np.load(array_path, allow_pickle=False)
+        except (OSError, ValueError, KeyError):
+            return None
+        
+    def put(self, key: str, array: np.ndarray):
+        """Store array under key and drop expired entries."""
+        array_path, stamp_path = self._paths(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to temp files and rename, so readers never see a partial entry
+            with open(array_path + ".tmp", 'wb') as f:
+                np.save(f, array, allow_pickle=False)
+            os.replace(array_path + ".tmp", array_path)
+            with open(stamp_path + ".tmp", 'w') as f:
+                json.dump({'expires': time.time() + self.ttl}, f)
+            os.replace(stamp_path + ".tmp", stamp_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache {key}: {e}")
+            return
+        self.prune()
+        
+    def prune(self):
+        """Delete expired entries."""
+        now = time.time()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            stamp_path = os.path.join(self.directory, name)
+            try:
+                with open(stamp_path) as f:
+                    if json.load(f)['expires'] >= now:
+                        continue
+                os.remove(stamp_path)
+                os.remove(stamp_path[:-len(".json")] + ".npy")
+            except (OSError, ValueError, KeyError):
+                continue
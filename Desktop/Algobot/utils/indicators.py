@@ -1,6 +1,20 @@
 """Technical indicators for trading strategies"""
 import numpy as np
 import pandas as pd
+try:
+    # Ahead-of-time build (python -m utils.build_aot): no JIT compile or cache load at startup
+    from ._indicators_aot import rsi_kernel, atr_kernel, macd_kernel, sma_kernel, ema_kernel
+    COMPILED_KERNELS = True
+except ImportError:
+    from .indicators_nb import (
+        NUMBA_AVAILABLE as COMPILED_KERNELS, rsi_kernel, atr_kernel, macd_kernel, sma_kernel, ema_kernel
+    )
+
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
 
 def calculate_rsi(series, period=14):
     """
@@ -13,9 +27,32 @@ def calculate_rsi(series, period=14):
     Returns:
         Pandas Series with RSI values
     """
-    delta = series.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    if COMPILED_KERNELS:
+        values = series.to_numpy(dtype=np.float64)
+        # Running sums can't skip gaps the way rolling() does
+        if not np.isnan(values).any():
+            out = np.empty(len(values))
+            rsi_kernel(values, period, out)
+            return pd.Series(out, index=series.index, name=series.name)
+    
+    if TALIB_AVAILABLE:
+        values = series.to_numpy(dtype=np.float64)
+        if not np.isnan(values).any():
+            # Rolling-mean RSI, not talib.RSI (Wilder); talib.SMA only replaces rolling().mean()
+            delta = np.diff(values, prepend=values[:1])
+            gain = talib.SMA(np.maximum(delta, 0.0), timeperiod=period)
+            loss = talib.SMA(np.maximum(-delta, 0.0), timeperiod=period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                out = 100 - (100 / (1 + gain / loss))
+            return pd.Series(out, index=series.index, name=series.name)
+    
+    values = series.to_numpy(dtype=np.float64)
+    delta = np.empty_like(values)
+    delta[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+    # fmax maps NaN deltas to 0, as where() did, without building boolean masks
+    gain = pd.Series(np.fmax(delta, 0.0), index=series.index, name=series.name).rolling(window=period).mean()
+    loss = pd.Series(np.fmax(-delta, 0.0), index=series.index, name=series.name).rolling(window=period).mean()
     
     rs = gain / loss
     return 100 - (100 / (1 + rs))
@@ -31,26 +68,53 @@ def calculate_atr(df, period=14):
     Returns:
         Pandas Series with ATR values
     """
-    high = df['high']
-    low = df['low']
-    close = df['close']
+    if COMPILED_KERNELS:
+        prices = [df[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close')]
+        # Running sums can't skip gaps the way rolling() does
+        if not any(np.isnan(values).any() for values in prices):
+            out = np.empty(len(df))
+            atr_kernel(*prices, period, out)
+            return pd.Series(out, index=df.index)
     
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = (high - close.shift()).abs()
-    tr3 = (low - close.shift()).abs()
+    high = df['high'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    prev_close = np.empty(len(df))
+    prev_close[:1] = np.nan
+    prev_close[1:] = df['close'].to_numpy(dtype=np.float64)[:-1]
     
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
+    # Calculate True Range; fmax skips NaN like DataFrame.max, so bar 0 is high - low
+    true_range = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    if TALIB_AVAILABLE and not np.isnan(true_range).any():
+        # Rolling-mean ATR, not talib.ATR (Wilder); talib.SMA only replaces rolling().mean()
+        return pd.Series(talib.SMA(true_range, timeperiod=period), index=df.index)
+    atr = pd.Series(true_range, index=df.index).rolling(window=period).mean()
     
     return atr
 
+def _compiled(kernel, series, window):
+    """Run a one-input kernel over series, or None when the pandas path must be used."""
+    if not COMPILED_KERNELS:
+        return None
+    values = series.to_numpy(dtype=np.float64)
+    # Running sums and recurrences can't skip gaps the way rolling()/ewm() do
+    if np.isnan(values).any():
+        return None
+    out = np.empty(len(values))
+    kernel(values, window, out)
+    return pd.Series(out, index=series.index, name=series.name)
+
 def calculate_sma(series, window):
     """Calculate Simple Moving Average"""
+    result = _compiled(sma_kernel, series, window)
+    if result is not None:
+        return result
     return series.rolling(window=window).mean()
 
 def calculate_ema(series, window):
     """Calculate Exponential Moving Average"""
+    result = _compiled(ema_kernel, series, window)
+    if result is not None:
+        return result
     return series.ewm(span=window, adjust=False).mean()
 
 def calculate_macd(series, fast=12, slow=26, signal=9):
@@ -60,6 +124,14 @@ def calculate_macd(series, fast=12, slow=26, signal=9):
     Returns:
         tuple: (macd_line, signal_line, histogram)
     """
+    if COMPILED_KERNELS:
+        values = series.to_numpy(dtype=np.float64)
+        # ewm() treats gaps differently from a plain recurrence
+        if not np.isnan(values).any():
+            out = np.empty((3, len(values)))
+            macd_kernel(values, fast, slow, signal, out)
+            return tuple(pd.Series(row, index=series.index, name=series.name) for row in out)
+    
     exp1 = series.ewm(span=fast, adjust=False).mean()
     exp2 = series.ewm(span=slow, adjust=False).mean()
     macd = exp1 - exp2
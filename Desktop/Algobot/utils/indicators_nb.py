@@ -0,0 +1,326 @@
+"""Compiled indicator kernels
+
+Numba is an optional dependency. When it is missing the kernels are plain
+Python functions and NUMBA_AVAILABLE is False, so callers can keep using the
+pandas implementations in utils.indicators instead.
+
+The public kernels carry explicit signatures, so importing this module
+compiles them (or loads them from the on-disk cache) up front instead of
+stalling the first generate_signals call. Callers must pass the dtypes
+listed below. Price inputs are typed as read-only arrays, which writable
+arrays also match, so views from Series.to_numpy() under pandas
+Copy-on-Write are accepted without a copy.
+"""
+import functools
+
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit, prange, float32, float64, int64, void, types
+
+if NUMBA_AVAILABLE:
+    # Read-only, any-layout 1d inputs
+    f32_in = types.Array(float32, 1, 'A', readonly=True)
+    f64_in = types.Array(float64, 1, 'A', readonly=True)
+    # Strategy kernels: float32 prices and outputs, float64 EMA resume state
+    COMPUTE_INDICATORS_SIGS = [void(
+        f32_in, f32_in, f32_in,
+        int64, int64, int64, int64, int64, int64, int64, int64,
+        float32[:], float32[:], float32[:], float32[:],
+        float64[:], float64[:], float32[:], float64[:],
+    )]
+    INDICATOR_KERNEL_SIGS = [void(
+        f32_in, f32_in, f32_in, int64,
+        float32[:], float32[:], float32[:], float32[:],
+        float64[:], float64[:], float32[:], float64[:],
+    )]
+    COMPUTE_INDICATORS_BATCH_SIGS = [void(
+        float32[:, :], float32[:, :], float32[:, :], int64[:],
+        int64, int64, int64, int64, int64, int64, int64,
+        float32[:, :], float32[:, :], float32[:, :], float32[:, :],
+        float64[:, :], float64[:, :], float32[:, :], float64[:, :],
+    )]
+    ROLLING_MEAN_SIGS = [void(f32_in, int64, float32[:])]
+    # utils.indicators kernels: float64 in and out
+    RSI_SIGS = [void(f64_in, int64, float64[:])]
+    ATR_SIGS = [void(f64_in, f64_in, f64_in, int64, float64[:])]
+    LATEST_ATR_SIGS = [float64(f64_in, f64_in, f64_in, int64)]
+    MACD_SIGS = [void(f64_in, int64, int64, int64, float64[:, :])]
+    SMA_SIGS = EMA_SIGS = [void(f64_in, int64, float64[:])]
+else:
+    COMPUTE_INDICATORS_SIGS = INDICATOR_KERNEL_SIGS = COMPUTE_INDICATORS_BATCH_SIGS = None
+    ROLLING_MEAN_SIGS = RSI_SIGS = ATR_SIGS = LATEST_ATR_SIGS = MACD_SIGS = None
+    SMA_SIGS = EMA_SIGS = None
+
+
+@njit(cache=True)
+def _gain_loss(close, i):
+    """Gain and loss of bar i versus bar i-1 (zero for the first bar)."""
+    if i == 0:
+        return 0.0, 0.0
+    delta = float(close[i]) - float(close[i - 1])
+    if delta > 0:
+        return delta, 0.0
+    return 0.0, -delta
+
+
+@njit(cache=True)
+def _true_range(high, low, close, i):
+    """True range of bar i (high-low for the first bar)."""
+    h = float(high[i])
+    lo = float(low[i])
+    tr = h - lo
+    if i > 0:
+        prev = float(close[i - 1])
+        tr = max(tr, abs(h - prev), abs(lo - prev))
+    return tr
+
+
+@njit(inline='always')
+def _indicators_core(close, high, low, short_w, long_w, rsi_p, atr_p,
+                     macd_fast, macd_slow, macd_sig, start,
+                     short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal):
+    """
+    Fill MA, RSI, ATR and MACD output arrays from index start onwards in a
+    single pass over the bars.
+
+    With start > 0 the outputs before start must already hold valid values:
+    the window sums are re-seeded from the preceding bars and the EMAs from
+    ema_fast/ema_slow/macd_signal[start - 1], so appending bars costs
+    O(window) instead of a full recompute.
+
+    Prices and outputs are float32 (ema_fast, ema_slow and macd_signal are
+    float64); sums and EMAs are always carried in float64.
+
+    Matches utils.indicators: MAs use min_periods=1, RSI and ATR are simple
+    rolling means of gains/losses and true range (NaN until the window is
+    full), MACD uses adjust=False EMAs.
+    """
+    n = close.shape[0]
+    sum_s = 0.0
+    sum_l = 0.0
+    sum_gain = 0.0
+    sum_loss = 0.0
+    sum_tr = 0.0
+    a_fast = 2.0 / (macd_fast + 1.0)
+    a_slow = 2.0 / (macd_slow + 1.0)
+    a_sig = 2.0 / (macd_sig + 1.0)
+    e_fast = 0.0
+    e_slow = 0.0
+    e_sig = 0.0
+
+    if start > 0:
+        # Window sums as they stood after bar start - 1
+        for j in range(max(0, start - short_w), start):
+            sum_s += float(close[j])
+        for j in range(max(0, start - long_w), start):
+            sum_l += float(close[j])
+        for j in range(max(0, start - rsi_p), start):
+            g, l = _gain_loss(close, j)
+            sum_gain += g
+            sum_loss += l
+        for j in range(max(0, start - atr_p), start):
+            sum_tr += _true_range(high, low, close, j)
+        e_fast = ema_fast[start - 1]
+        e_slow = ema_slow[start - 1]
+        e_sig = macd_signal[start - 1]
+
+    for i in range(start, n):
+        c = float(close[i])
+
+        # Moving averages (running window sums)
+        sum_s += c
+        if i >= short_w:
+            sum_s -= float(close[i - short_w])
+        short_ma[i] = sum_s / min(i + 1, short_w)
+        sum_l += c
+        if i >= long_w:
+            sum_l -= float(close[i - long_w])
+        long_ma[i] = sum_l / min(i + 1, long_w)
+
+        # RSI on rolling mean gain/loss
+        g, l = _gain_loss(close, i)
+        sum_gain += g
+        sum_loss += l
+        if i >= rsi_p:
+            g, l = _gain_loss(close, i - rsi_p)
+            sum_gain -= g
+            sum_loss -= l
+        # Clamp sliding-sum round-off so flat windows behave like pandas
+        gain_w = max(sum_gain, 0.0)
+        loss_w = max(sum_loss, 0.0)
+        if i < rsi_p - 1:
+            rsi[i] = np.nan
+        elif loss_w == 0.0:
+            rsi[i] = 100.0 if gain_w > 0.0 else np.nan
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + gain_w / loss_w)
+
+        # ATR on rolling mean true range
+        sum_tr += _true_range(high, low, close, i)
+        if i >= atr_p:
+            sum_tr -= _true_range(high, low, close, i - atr_p)
+        atr[i] = sum_tr / atr_p if i >= atr_p - 1 else np.nan
+
+        # MACD line and signal
+        if i == 0:
+            e_fast = c
+            e_slow = c
+        else:
+            e_fast = a_fast * c + (1.0 - a_fast) * e_fast
+            e_slow = a_slow * c + (1.0 - a_slow) * e_slow
+        m = e_fast - e_slow
+        e_sig = m if i == 0 else a_sig * m + (1.0 - a_sig) * e_sig
+        ema_fast[i] = e_fast
+        ema_slow[i] = e_slow
+        macd[i] = m
+        macd_signal[i] = e_sig
+
+
+
+
+@njit(COMPUTE_INDICATORS_SIGS, cache=True)
+def compute_indicators(close, high, low, short_w, long_w, rsi_p, atr_p,
+                       macd_fast, macd_slow, macd_sig, start,
+                       short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal):
+    """Fused indicator pass for runtime window sizes, see _indicators_core."""
+    _indicators_core(close, high, low, short_w, long_w, rsi_p, atr_p,
+                     macd_fast, macd_slow, macd_sig, start,
+                     short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal)
+
+
+@functools.lru_cache(maxsize=32)
+def make_indicator_kernel(short_w, long_w, rsi_p, atr_p, macd_fast, macd_slow, macd_sig):
+    """
+    compute_indicators specialised for fixed window sizes.
+
+    The windows are closure constants, so LLVM can fold them into the
+    sliding-window loops. Returns kernel(close, high, low, start, *outputs)
+    taking the same outputs as compute_indicators. Closures can't use the
+    on-disk cache, so each specialisation compiles once per process.
+    """
+    @njit(INDICATOR_KERNEL_SIGS)
+    def kernel(close, high, low, start,
+               short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal):
+        _indicators_core(close, high, low, short_w, long_w, rsi_p, atr_p,
+                         macd_fast, macd_slow, macd_sig, start,
+                         short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal)
+    return kernel
+
+@njit(COMPUTE_INDICATORS_BATCH_SIGS, parallel=True, nogil=True, cache=True)
+def compute_indicators_batch(close, high, low, lengths, short_w, long_w, rsi_p, atr_p,
+                             macd_fast, macd_slow, macd_sig,
+                             short_ma, long_ma, rsi, atr, ema_fast, ema_slow, macd, macd_signal):
+    """
+    compute_indicators over many symbols at once, one row per symbol.
+
+    Inputs and outputs are (symbols, bars) arrays; row s holds lengths[s]
+    bars and the rest of the row is ignored. Rows run in parallel threads.
+    """
+    for s in prange(close.shape[0]):
+        n = lengths[s]
+        _indicators_core(close[s, :n], high[s, :n], low[s, :n], short_w, long_w, rsi_p, atr_p,
+                         macd_fast, macd_slow, macd_sig, 0,
+                         short_ma[s, :n], long_ma[s, :n], rsi[s, :n], atr[s, :n],
+                         ema_fast[s, :n], ema_slow[s, :n], macd[s, :n], macd_signal[s, :n])
+
+@njit(RSI_SIGS, cache=True)
+def rsi_kernel(close, period, out):
+    """Rolling-mean RSI of close into out (same definition as calculate_rsi)."""
+    sum_gain = 0.0
+    sum_loss = 0.0
+    for i in range(close.shape[0]):
+        g, l = _gain_loss(close, i)
+        sum_gain += g
+        sum_loss += l
+        if i >= period:
+            g, l = _gain_loss(close, i - period)
+            sum_gain -= g
+            sum_loss -= l
+        gain_w = max(sum_gain, 0.0)
+        loss_w = max(sum_loss, 0.0)
+        if i < period - 1:
+            out[i] = np.nan
+        elif loss_w == 0.0:
+            out[i] = 100.0 if gain_w > 0.0 else np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + gain_w / loss_w)
+
+
+@njit(ATR_SIGS, cache=True)
+def atr_kernel(high, low, close, period, out):
+    """Rolling-mean ATR into out (same definition as calculate_atr)."""
+    sum_tr = 0.0
+    for i in range(close.shape[0]):
+        sum_tr += _true_range(high, low, close, i)
+        if i >= period:
+            sum_tr -= _true_range(high, low, close, i - period)
+        out[i] = sum_tr / period if i >= period - 1 else np.nan
+
+
+
+@njit(SMA_SIGS, cache=True)
+def sma_kernel(values, window, out):
+    """Rolling mean of values into out, NaN until the window is full (same as calculate_sma)."""
+    total = 0.0
+    for i in range(values.shape[0]):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        out[i] = total / window if i >= window - 1 else np.nan
+
+
+@njit(EMA_SIGS, cache=True)
+def ema_kernel(values, span, out):
+    """adjust=False EMA of values into out (same as calculate_ema)."""
+    alpha = 2.0 / (span + 1.0)
+    ema = 0.0
+    for i in range(values.shape[0]):
+        ema = values[i] if i == 0 else alpha * values[i] + (1.0 - alpha) * ema
+        out[i] = ema
+
+
+@njit(MACD_SIGS, cache=True)
+def macd_kernel(close, fast, slow, signal, out):
+    """
+    MACD line, signal line and histogram of close into the rows of out
+    (shape (3, n)) in one pass; same definition as calculate_macd.
+    """
+    a_fast = 2.0 / (fast + 1.0)
+    a_slow = 2.0 / (slow + 1.0)
+    a_sig = 2.0 / (signal + 1.0)
+    e_fast = 0.0
+    e_slow = 0.0
+    e_sig = 0.0
+    for i in range(close.shape[0]):
+        c = close[i]
+        if i == 0:
+            e_fast = c
+            e_slow = c
+        else:
+            e_fast = a_fast * c + (1.0 - a_fast) * e_fast
+            e_slow = a_slow * c + (1.0 - a_slow) * e_slow
+        m = e_fast - e_slow
+        e_sig = m if i == 0 else a_sig * m + (1.0 - a_sig) * e_sig
+        out[0, i] = m
+        out[1, i] = e_sig
+        out[2, i] = m - e_sig
+
+
+@njit(LATEST_ATR_SIGS, cache=True)
+def latest_atr(high, low, close, period):
+    """ATR of the last bar (same definition as calculate_atr), reading only the last period bars."""
+    n = close.shape[0]
+    total = 0.0
+    for i in range(n - period, n):
+        total += _true_range(high, low, close, i)
+    return total / period
+
+@njit(ROLLING_MEAN_SIGS, cache=True)
+def rolling_mean_kernel(values, window, out):
+    """Rolling mean with min_periods=1 (running window sum)."""
+    total = 0.0
+    for i in range(values.shape[0]):
+        total += float(values[i])
+        if i >= window:
+            total -= float(values[i - window])
+        out[i] = total / min(i + 1, window)
@@ -0,0 +1,70 @@
+"""Polars indicator expressions
+
+Polars is an optional dependency; POLARS_AVAILABLE is False when it is
+missing. The expressions follow utils.indicators exactly (rolling-mean RSI
+and ATR, min_periods=1 moving averages, adjust=False MACD EMAs), with NaN
+where the pandas versions have NaN, so they can be swapped in for frames
+that are already in Polars.
+"""
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    pl = None
+    POLARS_AVAILABLE = False
+
+
+def ma_expr(window, column="close"):
+    """Rolling mean with min_periods=1."""
+    return pl.col(column).rolling_mean(window_size=window, min_samples=1)
+
+
+def rsi_expr(period=14, column="close"):
+    """Rolling-mean RSI, same definition as calculate_rsi."""
+    delta = pl.col(column).diff()
+    gain = delta.clip(lower_bound=0).fill_null(0).rolling_mean(window_size=period)
+    loss = (-delta).clip(lower_bound=0).fill_null(0).rolling_mean(window_size=period)
+    return (100 - 100 / (1 + gain / loss)).fill_null(float("nan"))
+
+
+def atr_expr(period=14):
+    """Rolling-mean ATR, same definition as calculate_atr (bar 0 true range is high - low)."""
+    prev_close = pl.col("close").shift(1)
+    true_range = pl.max_horizontal(
+        pl.col("high") - pl.col("low"),
+        (pl.col("high") - prev_close).abs(),
+        (pl.col("low") - prev_close).abs(),
+    )
+    return true_range.rolling_mean(window_size=period).fill_null(float("nan"))
+
+
+def macd_exprs(fast=12, slow=26, signal=9, column="close"):
+    """MACD line and signal line, same definition as calculate_macd."""
+    macd = (pl.col(column).ewm_mean(span=fast, adjust=False)
+            - pl.col(column).ewm_mean(span=slow, adjust=False))
+    return macd, macd.ewm_mean(span=signal, adjust=False)
+
+
+def add_indicators(frame, short_window=10, long_window=30, rsi_period=14, atr_period=14,
+                   macd_fast=12, macd_slow=26, macd_signal=9):
+    """
+    Add Short_MA, Long_MA, RSI, ATR, MACD and MACD_Signal columns to a
+    Polars DataFrame or LazyFrame with high/low/close columns.
+
+    All columns are built in one lazy with_columns, so Polars evaluates
+    them in a single query instead of one pass per indicator. Returns a
+    DataFrame.
+    """
+    macd, signal = macd_exprs(macd_fast, macd_slow, macd_signal)
+    return (
+        frame.lazy()
+        .with_columns(
+            ma_expr(short_window).alias("Short_MA"),
+            ma_expr(long_window).alias("Long_MA"),
+            rsi_expr(rsi_period).alias("RSI"),
+            atr_expr(atr_period).alias("ATR"),
+            macd.alias("MACD"),
+            signal.alias("MACD_Signal"),
+        )
+        .collect()
+    )
@@ -4,6 +4,11 @@ import os
 import json
 from logging.handlers import RotatingFileHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class JsonFormatter(logging.Formatter):
     def format(self, record):
         log_record = {
@@ -14,14 +19,56 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             log_record['exception'] = self.formatException(record.exc_info)
+        # orjson writes non-ASCII as raw UTF-8; keep json's \u escapes for those
+        # records so consoles without UTF-8 (e.g. Windows cp1252) can still print them
+        if orjson is not None and all(value.isascii() for value in log_record.values()):
+            return orjson.dumps(log_record).decode()
         return json.dumps(log_record)
 
+# Formatters and handlers are shared between loggers with the same settings:
+# one formatter per format, one console handler per format and one rotating
+# handler per log file, instead of new ones (and a new file descriptor) for
+# every logger name.
+_FORMATTERS = {}
+_STREAM_HANDLERS = {}
+_FILE_HANDLERS = {}
+
+def _formatter(log_format: str) -> logging.Formatter:
+    formatter = _FORMATTERS.get(log_format)
+    if formatter is None:
+        if log_format == 'json':
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                '[%(asctime)s] %(levelname)s %(name)s: %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            )
+        _FORMATTERS[log_format] = formatter
+    return formatter
+
+def _stream_handler(log_format: str) -> logging.Handler:
+    handler = _STREAM_HANDLERS.get(log_format)
+    if handler is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_formatter(log_format))
+        _STREAM_HANDLERS[log_format] = handler
+    return handler
+
+def _file_handler(log_file: str, log_format: str, max_bytes: int, backup_count: int) -> logging.Handler:
+    key = (os.path.abspath(log_file), log_format, max_bytes, backup_count)
+    handler = _FILE_HANDLERS.get(key)
+    if handler is None:
+        handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+        handler.setFormatter(_formatter(log_format))
+        _FILE_HANDLERS[key] = handler
+    return handler
+
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if logger.handlers:
         return logger
 
-    # Configurable log format
+    # Configurable log format; read per call since scripts set LOG_FORMAT after some imports
     log_format = os.environ.get('LOG_FORMAT', 'plain')  # 'json' or 'plain'
     log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
     log_file = os.environ.get('LOG_FILE', f'{name}.log')
@@ -29,22 +76,11 @@ def get_logger(name: str) -> logging.Logger:
     backup_count = int(os.environ.get('LOG_BACKUP_COUNT', 5))
 
     # Console handler
-    stream_handler = logging.StreamHandler(sys.stdout)
-    if log_format == 'json':
-        formatter = JsonFormatter()
-    else:
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s %(name)s: %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    logger.addHandler(_stream_handler(log_format))
 
     # Rotating file handler
-    file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    logger.addHandler(_file_handler(log_file, log_format, max_bytes, backup_count))
 
     logger.setLevel(getattr(logging, log_level, logging.INFO))
     logger.propagate = False
-    return logger 
\ No newline at end of file
+    return logger 
@@ -3,6 +3,7 @@ News Filter Module
 Avoid trading during high-impact news events
 """
 
+import bisect
 import pandas as pd
 from datetime import datetime, timedelta
 from utils.logger import get_logger
@@ -10,10 +11,22 @@ from config import AVOID_NEWS, MINUTES_BEFORE_NEWS, MINUTES_AFTER_NEWS
 
 logger = get_logger("NewsFilter")
 
+_EPOCH = datetime(1970, 1, 1)
+
+def _seconds(dt):
+    """Sort key for a datetime in seconds; naive times are compared as naive, like subtraction does."""
+    if dt.tzinfo is None:
+        return (dt - _EPOCH).total_seconds()
+    return dt.timestamp()
+
 class NewsFilter:
     def __init__(self):
         self.news_events = []
         self.is_enabled = AVOID_NEWS
+        # High-impact events per currency as parallel sorted lists of
+        # (seconds, event time), for binary search instead of scanning news_events
+        self._events_by_ccy = {}
+        self._ccy_cache = {}
         
     def add_news_event(self, event_time, currency, impact="high", description=""):
         """Add a news event to the filter."""
@@ -24,6 +37,11 @@ class NewsFilter:
             'description': description
         }
         self.news_events.append(event)
+        if impact == 'high':
+            seconds, times = self._events_by_ccy.setdefault(currency, ([], []))
+            i = bisect.bisect_right(seconds, _seconds(event_time))
+            seconds.insert(i, _seconds(event_time))
+            times.insert(i, event_time)
         logger.info(f"Added news event: {currency} at {event_time} ({impact} impact)")
     
     def is_news_time(self, symbol, current_time=None):
@@ -39,25 +57,36 @@ class NewsFilter:
         if not currency:
             return False
             
-        # Check for news events in the time window
-        for event in self.news_events:
-            if event['currency'] == currency and event['impact'] == 'high':
-                event_time = event['time']
-                time_diff = abs((current_time - event_time).total_seconds() / 60)
-                
-                if time_diff <= (MINUTES_BEFORE_NEWS + MINUTES_AFTER_NEWS):
-                    logger.warning(f"News filter active: {currency} news at {event_time}")
-                    return True
+        events = self._events_by_ccy.get(currency)
+        if not events:
+            return False
+        seconds, times = events
+        
+        # Check for news events in the time window: the first event at or
+        # after its start is the only candidate
+        now = _seconds(current_time)
+        window = (MINUTES_BEFORE_NEWS + MINUTES_AFTER_NEWS) * 60
+        i = bisect.bisect_left(seconds, now - window)
+        if i < len(seconds) and seconds[i] <= now + window:
+            logger.warning(f"News filter active: {currency} news at {times[i]}")
+            return True
                     
         return False
     
     def _extract_currency(self, symbol):
         """Extract currency from symbol (e.g., XAUUSD -> USD)."""
+        try:
+            return self._ccy_cache[symbol]
+        except KeyError:
+            pass
         if symbol.startswith('XAU'):
-            return 'USD'  # Gold is typically quoted in USD
+            currency = 'USD'  # Gold is typically quoted in USD
         elif len(symbol) >= 6:
-            return symbol[3:6]  # Extract base currency
-        return None
+            currency = symbol[3:6]  # Extract base currency
+        else:
+            currency = None
+        self._ccy_cache[symbol] = currency
+        return currency
     
     def get_safe_trading_window(self, symbol):
         """Get the next safe trading window for a symbol."""
@@ -68,20 +97,17 @@ class NewsFilter:
         if not currency:
             return True
             
-        current_time = datetime.now()
+        events = self._events_by_ccy.get(currency)
+        if not events:
+            return True
+        seconds, _ = events
         
         # Find the next news event for this currency
-        for event in sorted(self.news_events, key=lambda x: x['time']):
-            if event['currency'] == currency and event['impact'] == 'high':
-                event_time = event['time']
-                
-                # If we're before the news event
-                if current_time < event_time:
-                    time_to_news = (event_time - current_time).total_seconds() / 60
-                    if time_to_news > MINUTES_BEFORE_NEWS:
-                        return True
-                    else:
-                        return False
+        now = _seconds(datetime.now())
+        i = bisect.bisect_right(seconds, now)
+        if i < len(seconds):
+            time_to_news = (seconds[i] - now) / 60
+            return time_to_news > MINUTES_BEFORE_NEWS
                         
         return True
     